@@ -48,20 +48,29 @@ def bold(line):
     >>> bold('<b>first</b> <b>second:</b>')
     (['first', 'second:'], [])
     """
+    if "<b>" not in line:
+        return [], [line] if line and not line.isspace() else []
+
+    # scan for <b>text</b> spans by hand, matching what _section would: the
+    # bolded text is non-empty and runs up to the first '<', which has to
+    # open the closing tag
     inside = []
-    inside.extend(m.span(0) for m in _section.finditer(line))
-    current = 0
     outside = []
-    for start, end in inside:
-        outside.append((current, start))
-        current = end
-    outside.append((current, len(line)))
-
-    inside = [line[s:e] for s, e in inside]
-    inside = [s.replace("<b>", "").replace("</b>", "") for s in inside]
+    current = pos = 0
+    while True:
+        start = line.find("<b>", pos)
+        if start == -1:
+            break
+        end = line.find("<", start + 3)
+        if end == start + 3 or not line.startswith("</b>", end):
+            pos = start + 1
+            continue
+        outside.append(line[current:start])
+        inside.append(line[start + 3:end])
+        current = pos = end + 4
+    outside.append(line[current:])
 
-    outside = [line[s:e] for s, e in outside]
-    outside = [line for line in outside if line and not line.isspace()]
+    outside = [s for s in outside if s and not s.isspace()]
     return inside, outside
 
 
@@ -125,6 +134,13 @@ for s in _replacementsnoprefix:
     x = "".join(x)
     _replacements.append((x, f"{s}</u>"))
 
+# every replacement above is a literal string, so they're folded into a
+# single alternation and applied in one pass per line
+_replacementsmap = dict(_replacements)
+_replacementsre = re.compile(
+    "|".join(re.escape(lookfor) for lookfor, _ in _replacements)
+)
+
 _href = re.compile(r'<a href="file:///[^\?]*\?([^\(]*)\(([^\)]*)\)">')
 _section = re.compile(r"<b>([^<]+)</b>")
 
@@ -134,14 +150,14 @@ def _parsetext(lines):
     section = None
     i = 0
     for line in lines:
-        line = re.sub(
-            _href,
+        line = _href.sub(
             r'<a href="http://manpages.ubuntu.com/manpages/precise/en/'
             r'man\2/\1.\2.html">',
             line,
         )
-        for lookfor, replacewith in _replacements:
-            line = re.sub(lookfor, replacewith, line)
+        line = _replacementsre.sub(
+            lambda m: _replacementsmap[m.group(0)], line
+        )
         # confirm the line is valid utf8
         # Ensure valid UTF-8 by encoding/decoding safely in Python 3
         line_bytes = line if isinstance(line,
@@ -153,7 +169,7 @@ def _parsetext(lines):
             line = linereplaced.decode('utf-8', 'ignore')
             raise ValueError
         if line.startswith('<b>'):  # section
-            section = re.sub(_section, r'\1', line)
+            section = _section.sub(r"\1", line)
         else:
             foundsection = False
             if line.strip().startswith("<b>"):
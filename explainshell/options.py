@@ -30,8 +30,11 @@ def extract(manpage):
 
 opt_regex = re.compile(
     r"""
-    (?P<opt>--?(?:\?|\#|(?:\w+-)*\w+))  # option starts with - or --,
-    # can have - in the middle but not at the end, also allow '-?'
+    (?P<opt>(?>--?(?:\?|\#|(?:\w+-)*\w+)))  # option starts with - or --,
+    # can have - in the middle but not at the end, also allow '-?'.
+    # atomic: giving back part of the name never leads to a match the
+    # full name misses, and retrying every shorter name made words like
+    # -AAAA...: quadratic
     (?:
      (?:\s?(=)?\s?)           # -a=
      (?P<argoptional>[<\[])?  # -a=< or -a=[
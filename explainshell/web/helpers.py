@@ -1,10 +1,15 @@
+import operator
+
 from explainshell import util
 
+_bysection = operator.attrgetter("section")
+
 
 def convertparagraphs(manpage):
     for p in manpage.paragraphs:
-        if isinstance(p.text, bytes):
-            p.text = p.text.decode("utf-8", "ignore")
+        text = p.text
+        if isinstance(text, bytes):
+            p.text = text.decode("utf-8", "ignore")
     return manpage
 
 
@@ -15,11 +20,8 @@ def suggestions(matches, command):
         if "name" in m and "suggestions" in m:
             before = command[: m["start"]]
             after = command[m["end"]:]
-            newsuggestions = []
-            for othermp in sorted(m["suggestions"], key=lambda mp: mp.section):
-                mid = f"{othermp.name}.{othermp.section}"
-                newsuggestions.append(
-                    {"cmd": "".join([before, mid, after]),
-                     "text": othermp.namesection}
-                )
-            m["suggestions"] = newsuggestions
+            m["suggestions"] = [
+                {"cmd": f"{before}{othermp.name}.{othermp.section}{after}",
+                 "text": othermp.namesection}
+                for othermp in sorted(m["suggestions"], key=_bysection)
+            ]
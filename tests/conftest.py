@@ -0,0 +1,63 @@
+import collections
+import copy
+from unittest.mock import Mock, patch
+
+import pytest
+
+# load the modules most test files share once, when pytest reads this
+# conftest, so each worker pays their import cost before collection starts
+from explainshell import errors, manager, manpage, store  # noqa: F401
+
+
+mockeddeps = collections.namedtuple("mockeddeps", "store classifier fixer")
+
+# the real class, captured before any test patches explainshell.store.store
+_storespec = store.store
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "slow: extreme workloads, deselect with -m 'not slow'"
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_clf_cls():
+    """the classifier class, patched once for the whole module"""
+    with patch(
+        "explainshell.manager.classifier.classifier", spec_set=True
+    ) as clf_cls:
+        yield clf_cls
+
+
+@pytest.fixture
+def mocked_manager_deps(mock_clf_cls):
+    """patch the store class and fixer runner manager.manager wires up and
+    hand back all three patched collaborators; the shared classifier is
+    reset so call counts stay per test"""
+    mock_clf_cls.reset_mock()
+    with patch(
+        "explainshell.manager.store.store", spec_set=True
+    ) as store_cls, patch(
+        "explainshell.manager.fixer.runner", spec_set=True
+    ) as runner:
+        yield mockeddeps(store_cls, mock_clf_cls, runner)
+
+
+@pytest.fixture(scope="module")
+def module_manager():
+    """a manager built once per module; constructor wiring isn't what
+    the tests using it exercise, so the patches only cover building it"""
+    with patch("explainshell.manager.store.store"), patch(
+        "explainshell.manager.classifier.classifier"
+    ):
+        return manager.manager("localhost", "testdb", set())
+
+
+@pytest.fixture
+def mgr(module_manager):
+    """a copy of the module-level manager with a fresh, spec'd store mock,
+    so attributes a test sets never leak into the next one"""
+    m = copy.copy(module_manager)
+    m.store = Mock(spec=_storespec)
+    return m
@@ -64,6 +64,3 @@ class mockstore(object):
             return self.dup if x == "dup" else [self.manpages[x]]
         except KeyError as e:
             raise errors.ProgramDoesNotExist(x) from e
-
-
-s = mockstore()
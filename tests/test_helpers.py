@@ -1,12 +1,8 @@
 import contextlib
 import unittest
 from unittest.mock import Mock
-import sys
-import os
-from explainshell.web import helpers
 
-# Add the parent directory to the path to import explainshell modules
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from explainshell.web import helpers
 
 
 class TestHelpers(unittest.TestCase):
@@ -1,308 +1,167 @@
-import contextlib
-import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
-import tempfile
+
+import pytest
 
 from explainshell import manager
 
 
-class TestManagerEdgeCases(unittest.TestCase):
-    """Test edge cases and error conditions for manager.py"""
-
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def test_manager_with_invalid_paths(self):
-        """Test manager behavior with invalid file paths"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mgr = manager.manager(
-                "localhost", "testdb", {"/nonexistent/file.gz"}
-            )
-
-            with patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class:
-                mock_manpage_class.side_effect = FileNotFoundError(
-                    "File not found"
-                )
-
-                with contextlib.suppress(FileNotFoundError):
-                    added, exists = mgr.run()
-                    self.assertEqual(added, [])
-                    self.assertEqual(exists, [])
-
-    def test_manager_with_keyboard_interrupt(self):
-        """Test manager handling of KeyboardInterrupt"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mgr = manager.manager(
-                "localhost", "testdb", {"test.1.gz"}
-            )
-
-            with patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class:
-                mock_manpage_class.side_effect = KeyboardInterrupt()
-
-                with self.assertRaises(KeyboardInterrupt):
-                    mgr.run()
-
-    def test_manager_with_value_error(self):
-        """Test manager handling of ValueError during processing"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
-
-            with patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class:
-                mock_manpage_class.side_effect = ValueError("Invalid value")
-
-                added, exists = mgr.run()
-
-                self.assertEqual(added, [])
-                self.assertEqual(exists, [])
-
-    def test_manager_with_generic_exception(self):
-        """Test manager handling of generic exceptions"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
-
-            with patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class:
-                mock_manpage_class.side_effect = RuntimeError("Generic error")
-
-                with self.assertRaises(RuntimeError):
-                    mgr.run()
-
-    def test_findmulticommands_no_potential_commands(self):
-        """Test findmulticommands when no potential multicommands exist"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch("explainshell.manager.classifier.classifier"),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Only simple commands, no hyphens
-            mock_store_instance.names.return_value = [
-                ("id1", "ls"),
-                ("id2", "cat"),
-                ("id3", "grep"),
-            ]
-            mock_store_instance.mappings.return_value = []
-
-            self._extracted_from_test_findmulticommands_no_parent_command_21()
-
-    def test_findmulticommands_existing_mappings(self):
-        """Test findmulticommands when mappings already exist"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch("explainshell.manager.classifier.classifier"),
-        ):
-
-            mock_store_instance = (
-                self._ext_from_test_findmulticommands_no_parent_10(
-                    mock_store_class, "git", "git-rebase"
-                )
-            )
-            # Mapping already exists
-            mock_store_instance.mappings.return_value = [("git rebase", "id2")]
-
-            self._extracted_from_test_findmulticommands_no_parent_command_21()
-
-    def test_findmulticommands_no_parent_command(self):
-        """Test findmulticommands when parent command doesn't exist"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch("explainshell.manager.classifier.classifier"),
-        ):
-
-            mock_store_instance = (
-                self._ext_from_test_findmulticommands_no_parent_10(
-                    mock_store_class, "git-rebase", "other-command"
-                )
-            )
-            mock_store_instance.mappings.return_value = []
-
-            self._extracted_from_test_findmulticommands_no_parent_command_21()
-
-    # TODO Rename this helper method
-    def _ext_from_test_findmulticommands_no_parent_10(
-        self, mock_store_class, arg1, arg2
+# every test runs with manager.manager's collaborators patched out
+pytestmark = pytest.mark.usefixtures("mocked_manager_deps")
+
+
+@pytest.mark.parametrize(
+    "exc_class, message, should_raise",
+    [
+        # an unreadable path surfaces as an uncaught exception
+        (FileNotFoundError, "File not found", True),
+        (KeyboardInterrupt, "", True),
+        (ValueError, "Invalid value", False),
+        (RuntimeError, "Generic error", True),
+    ],
+    ids=["invalid_paths", "keyboard_interrupt", "value_error",
+         "generic_exception"],
+)
+def test_manager_with_manpage_error(exc_class, message, should_raise):
+    """Test manager handling of errors raised while reading a manpage"""
+    mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
+
+    with patch(
+        "explainshell.manager.manpage.manpage",
+        side_effect=exc_class(message),
     ):
-        result = Mock()
-        mock_store_class.return_value = result
-        result.names.return_value = [("id1", arg1), ("id2", arg2)]
-        return result
-
-    # TODO Rename this helper method
-    def _extracted_from_test_findmulticommands_no_parent_command_21(self):
-        mgr = manager.manager("localhost", "testdb", set())
-        mappings, multicommands = mgr.findmulticommands()
-        self.assertEqual(mappings, [])
-        self.assertEqual(multicommands, {})
-
-    def test_process_with_no_paragraphs(self):
-        """Test process method when manpage has no paragraphs"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch("explainshell.manager.fixer.runner"),
-        ):
-
-            mgr = manager.manager("localhost", "testdb", set())
-
-            mock_manpage = Mock()
-            mock_manpage.name = "test"
-            mock_manpage.paragraphs = []  # No paragraphs
-            mock_manpage.read = Mock()
-            mock_manpage.parse = Mock()
-
-            ctx = mgr.ctx(mock_manpage)
-
-            with self.assertRaises(AssertionError):
-                mgr.process(ctx)
-
-    def test_process_with_no_options_extracted(self):
-        """Test process method when no options are extracted"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch("explainshell.manager.fixer.runner"),
-            patch("explainshell.manager.options.extract"),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            mgr = manager.manager("localhost", "testdb", set())
-
-            mock_manpage = Mock()
-            mock_manpage.name = "test"
-            mock_manpage.paragraphs = [Mock(), Mock()]  # Has paragraphs
-            mock_manpage.options = []  # No options after extraction
-            mock_manpage.read = Mock()
-            mock_manpage.parse = Mock()
-            mock_manpage.shortpath = "test.1.gz"
-            mock_manpage.synopsis = "test synopsis"
-            mock_manpage.aliases = [("test", 10)]
-
-            ctx = mgr.ctx(mock_manpage)
-            ctx.classifier = Mock()
-            ctx.classifier.classify = Mock(return_value=[])
-
-            mock_store_instance.addmanpage.return_value = mock_manpage
-
-            result = mgr.process(ctx)
-
-            # Should still process successfully even without options
-            self.assertEqual(result, mock_manpage)
-
-    def test_edit_with_empty_manpage(self):
-        """Test edit method with empty manpage"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch("explainshell.manager.fixer.runner"),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            mgr = manager.manager("localhost", "testdb", set())
-
-            mock_manpage = Mock()
-            mock_manpage.name = "test"
-            mock_manpage.paragraphs = []
-
-            mock_store_instance.updatemanpage.return_value = mock_manpage
-
-            result = mgr.edit(mock_manpage)
-
-            self.assertEqual(result, mock_manpage)
-
-    def test_manager_ctx_with_none_values(self):
-        """Test managerctx with None values"""
-        mock_manpage = Mock()
-        mock_manpage.name = "test"
-        ctx = manager.managerctx(None, None, mock_manpage)
-
-        self.assertIsNone(ctx.classifier)
-        self.assertIsNone(ctx.store)
-        self.assertEqual(ctx.name, "test")
-
-    def test_run_with_updated_manpage_no_overwrite(self):
-        """Test run method with updated manpage and overwrite=False"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class,
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Mock existing updated manpage
-            existing_mp = Mock()
-            existing_mp.source = "test.1.gz"
-            existing_mp.updated = True  # Already updated
-            mock_store_instance.findmanpage.return_value = [existing_mp]
-
-            # Mock new manpage
-            new_mp = Mock()
-            new_mp.name = "test"
-            new_mp.shortpath = "test.1.gz"
-            mock_manpage_class.return_value = new_mp
-
-            mgr = manager.manager(
-                "localhost", "testdb", {"test.1.gz"}, overwrite=True
-            )
-            added, exists = mgr.run()
-
-            # Should not overwrite updated manpage even with overwrite=True
-            self.assertEqual(len(added), 0)
-            self.assertEqual(len(exists), 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        if should_raise:
+            with pytest.raises(exc_class):
+                mgr.run()
+        else:
+            assert mgr.run() == ([], [])
+
+
+def test_findmulticommands_no_potential_commands(mgr):
+    """Test findmulticommands when no potential multicommands exist"""
+    # Only simple commands, no hyphens
+    _setnames(mgr.store, "ls", "cat", "grep")
+    mgr.store.mappings.return_value = []
+
+    _assertnomulticommands(mgr)
+
+
+def test_findmulticommands_existing_mappings(mgr):
+    """Test findmulticommands when mappings already exist"""
+    _setnames(mgr.store, "git", "git-rebase")
+    # Mapping already exists
+    mgr.store.mappings.return_value = [("git rebase", "id2")]
+
+    _assertnomulticommands(mgr)
+
+
+def test_findmulticommands_no_parent_command(mgr):
+    """Test findmulticommands when parent command doesn't exist"""
+    _setnames(mgr.store, "git-rebase", "other-command")
+    mgr.store.mappings.return_value = []
+
+    _assertnomulticommands(mgr)
+
+
+def _setnames(mock_store, *names):
+    mock_store.names.return_value = [
+        (f"id{i}", name) for i, name in enumerate(names, 1)
+    ]
+
+
+def _assertnomulticommands(mgr):
+    mappings, multicommands = mgr.findmulticommands()
+    assert mappings == []
+    assert multicommands == {}
+
+
+def test_process_with_no_paragraphs(mgr):
+    """Test process method when manpage has no paragraphs"""
+    mock_manpage = SimpleNamespace(
+        name="test",
+        paragraphs=[],  # No paragraphs
+        read=lambda: None,
+        parse=lambda: None,
+    )
+
+    ctx = mgr.ctx(mock_manpage)
+
+    with pytest.raises(AssertionError):
+        mgr.process(ctx)
+
+
+def test_process_with_no_options_extracted(mgr):
+    """Test process method when no options are extracted"""
+    with patch("explainshell.manager.options.extract"):
+        mock_manpage = SimpleNamespace(
+            name="test",
+            # Has paragraphs
+            paragraphs=[SimpleNamespace(), SimpleNamespace()],
+            options=[],  # No options after extraction
+            shortpath="test.1.gz",
+            synopsis="test synopsis",
+            aliases=[("test", 10)],
+            read=lambda: None,
+            parse=lambda: None,
+        )
+
+        ctx = mgr.ctx(mock_manpage)
+        ctx.classifier = Mock()
+        ctx.classifier.classify = Mock(return_value=[])
+
+        mgr.store.addmanpage.return_value = mock_manpage
+
+        result = mgr.process(ctx)
+
+        # Should still process successfully even without options
+        assert result == mock_manpage
+
+
+def test_edit_with_empty_manpage(mgr):
+    """Test edit method with empty manpage"""
+    mock_manpage = SimpleNamespace(name="test", paragraphs=[], options=[])
+
+    mgr.store.updatemanpage.return_value = mock_manpage
+
+    result = mgr.edit(mock_manpage)
+
+    assert result == mock_manpage
+
+
+def test_manager_ctx_with_none_values():
+    """Test managerctx with None values"""
+    mock_manpage = SimpleNamespace(name="test")
+    ctx = manager.managerctx(None, None, mock_manpage)
+
+    assert ctx.classifier is None
+    assert ctx.store is None
+    assert ctx.name == "test"
+
+
+def test_run_with_updated_manpage_no_overwrite(mocked_manager_deps):
+    """Test run method with updated manpage and overwrite=False"""
+    with patch(
+        "explainshell.manager.manpage.manpage"
+    ) as mock_manpage_class:
+        mock_store_instance = Mock()
+        mocked_manager_deps.store.return_value = mock_store_instance
+
+        # Mock existing updated manpage
+        existing_mp = SimpleNamespace(
+            source="test.1.gz",
+            updated=True,  # Already updated
+        )
+        mock_store_instance.findmanpage.return_value = [existing_mp]
+
+        # Mock new manpage
+        new_mp = SimpleNamespace(name="test", shortpath="test.1.gz")
+        mock_manpage_class.return_value = new_mp
+
+        mgr = manager.manager(
+            "localhost", "testdb", {"test.1.gz"}, overwrite=True
+        )
+        added, exists = mgr.run()
+
+        # Should not overwrite updated manpage even with overwrite=True
+        assert len(added) == 0
+        assert len(exists) == 1
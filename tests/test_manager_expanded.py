@@ -1,95 +1,68 @@
-import unittest
-import tempfile
-import shutil
-from unittest.mock import Mock, patch
-
-from explainshell import manager, store
-
-
-class TestManagerExpanded(unittest.TestCase):
-    """Expanded test framework for manager.py"""
-
-    def setUp(self):
-        """Set up test environment"""
-        self.test_db = "explainshell_test_expanded"
-        self.temp_dir = tempfile.mkdtemp()
-        self.mock_store = Mock(spec=store.store)
-
-    def tearDown(self):
-        """Clean up test environment"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
-    def _create_mock_manpage(self, name="test", source="test.1.gz"):
-        """Create a mock manpage object"""
-        mock_mp = Mock()
-        mock_mp.name = name
-        mock_mp.source = source
-        mock_mp.shortpath = source
-        mock_mp.synopsis = f"{name} - test synopsis"
-        # Create mock paragraphs with cleantext method
-        mock_paragraphs = []
-        for i in range(5):
-            p = Mock()
-            p.cleantext.return_value = f"test paragraph {i}"
-            p.is_option = True
-            p.idx = i
-            mock_paragraphs.append(p)
-        mock_mp.paragraphs = mock_paragraphs
-        mock_mp.aliases = [(name, 10)]
-        mock_mp.options = []
-        mock_mp.updated = False
-        return mock_mp
-
-    def test_manager_initialization(self):
-        """Test manager initialization with various parameters"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ) as mock_classifier_class:
-
-            mock_store_instance = Mock()
-            mock_classifier_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-            mock_classifier_class.return_value = mock_classifier_instance
-
-            # Test basic initialization
-            mgr = manager.manager("localhost", "testdb", {"/path/to/file.gz"})
-
-            self.assertEqual(mgr.paths, {"/path/to/file.gz"})
-            self.assertFalse(mgr.overwrite)
-            mock_store_class.assert_called_once_with("testdb", "localhost")
-            mock_classifier_instance.train.assert_called_once()
-
-    def test_edit_method(self):
-        """Test edit method"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ), patch(
-            "explainshell.manager.fixer.runner"
-        ) as mock_fixer:
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            mock_fixer_instance = Mock()
-            mock_fixer.return_value = mock_fixer_instance
-
-            mgr = manager.manager("localhost", "testdb", set())
-            mock_manpage = self._create_mock_manpage()
-            mock_manpage.options = []
-
-            mock_store_instance.updatemanpage.return_value = mock_manpage
-
-            result = mgr.edit(mock_manpage)
-
-            self.assertEqual(result, mock_manpage)
-            mock_store_instance.updatemanpage.assert_called_once_with(
-                mock_manpage
-            )
-
-
-if __name__ == "__main__":
-    unittest.main()
+from types import SimpleNamespace
+from unittest.mock import call
+
+import pytest
+
+from explainshell import manager
+
+
+# built once at import; options.extract only ever swaps list items, so the
+# paragraph objects themselves are safe to share between manpages
+_PROTO_PARAGRAPHS = tuple(
+    SimpleNamespace(
+        cleantext=lambda text=f"test paragraph {i}": text,
+        is_option=True,
+        idx=i,
+    )
+    for i in range(5)
+)
+
+
+def _create_mock_manpage(name="test", source="test.1.gz"):
+    """Create a mock manpage object"""
+    return SimpleNamespace(
+        name=name,
+        source=source,
+        shortpath=source,
+        synopsis=f"{name} - test synopsis",
+        paragraphs=list(_PROTO_PARAGRAPHS),
+        aliases=[(name, 10)],
+        options=[],
+        updated=False,
+    )
+
+
+@pytest.fixture
+def mock_manpage():
+    """a fresh manpage stand-in over the shared prototype paragraphs"""
+    return _create_mock_manpage()
+
+
+def test_manager_initialization(mocked_manager_deps):
+    """Test manager initialization with various parameters"""
+    mock_classifier_instance = mocked_manager_deps.classifier.return_value
+
+    # Test basic initialization
+    mgr = manager.manager("localhost", "testdb", {"/path/to/file.gz"})
+
+    assert mgr.paths == {"/path/to/file.gz"}
+    assert not mgr.overwrite
+    assert mocked_manager_deps.store.call_args == call("testdb", "localhost")
+    assert mocked_manager_deps.store.call_count == 1
+    mock_classifier_instance.train.assert_called_once()
+
+
+def test_edit_method(mocked_manager_deps, mock_manpage):
+    """Test edit method"""
+    mock_store_instance = mocked_manager_deps.store.return_value
+
+    mgr = manager.manager("localhost", "testdb", set())
+
+    mock_store_instance.updatemanpage.return_value = mock_manpage
+
+    result = mgr.edit(mock_manpage)
+
+    assert result == mock_manpage
+    updatemanpage = mock_store_instance.updatemanpage
+    assert updatemanpage.call_args == call(mock_manpage)
+    assert updatemanpage.call_count == 1
@@ -1,85 +1,59 @@
-import unittest
-from unittest.mock import patch
-import os
 import sys
-from explainshell.manager import main
+from unittest.mock import patch
 
-# Add the parent directory to the Python path to allow for imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(
-    __file__), '..')))
+import pytest
 
+from explainshell.manager import main
 
-class TestMainFunction(unittest.TestCase):
 
-    @patch('explainshell.manager.store.store')
-    def test_main_with_verify(self, mock_store):
-        """Test main function with --verify flag"""
-        mock_s_instance = mock_store.return_value
-        mock_s_instance.verify.return_value = (True, [], [])
+@patch('explainshell.manager.store.store', spec_set=True)
+def test_main_with_verify(mock_store):
+    """Test main function with --verify flag"""
+    mock_s_instance = mock_store.return_value
+    mock_s_instance.verify.return_value = (True, [], [])
 
-        # Simulate command-line arguments
-        test_args = ["manager.py", "--db", "testdb",
-                     "--host", "localhost", "--verify"]
+    # Simulate command-line arguments
+    test_args = ["manager.py", "--db", "testdb",
+                 "--host", "localhost", "--verify"]
 
-        with patch.object(sys, 'argv', test_args):
-            # The main function should return 0 on success
-            self.assertEqual(main([], "testdb", "localhost",
-                                  False, False, True), 0)
+    with patch.object(sys, 'argv', test_args):
+        # The main function should return 0 on success
+        assert main([], "testdb", "localhost", False, False, True) == 0
 
-            # Verify that the store's verify method was called
-            mock_s_instance.verify.assert_called_once()
+        # Verify that the store's verify method was called
+        mock_s_instance.verify.assert_called_once()
 
-    @patch('builtins.input', return_value='y')
-    @patch('explainshell.manager.manager')
-    @patch('explainshell.store.store')
-    def test_main_with_drop_yes(self, mock_store, mock_manager, mock_input):
-        """Test main function with --drop flag and 'y' input"""
-        mock_manager.return_value.run.return_value = ([], [])
-        main([], "testdb", "localhost", False, True, False)
-        self.assertTrue(mock_manager.called)
 
-    @patch('builtins.input', return_value='n')
-    @patch('explainshell.manager.manager')
-    @patch('explainshell.store.store')
-    def test_main_with_drop_no(self, mock_store, mock_manager, mock_input):
-        """Test main function with --drop flag and 'n' input"""
+@pytest.mark.parametrize('answer', ['y', 'n'])
+def test_main_with_drop(answer):
+    """Test main function with --drop flag and 'y'/'n' input"""
+    with patch('builtins.input', return_value=answer), \
+            patch('explainshell.manager.manager',
+                  spec_set=True) as mock_manager, \
+            patch('explainshell.store.store', spec_set=True):
         mock_manager.return_value.run.return_value = ([], [])
         main([], "testdb", "localhost", False, True, False)
-        self.assertTrue(mock_manager.called)
+        assert mock_manager.called
 
-    @patch('explainshell.manager.manager')
-    @patch('explainshell.store.store')
-    def test_main_with_directory(self, mock_store, mock_manager):
-        """Test main function with a directory path"""
-        mock_manager.return_value.run.return_value = ([], [])
-        with patch('os.path.isdir', return_value=True):
-            with patch('glob.glob', return_value=['/test/path/to/file.gz']):
-                main(['/test/path'], "testdb", "localhost",
-                     False, False, False)
-                self.assertTrue(mock_manager.called)
 
-    @patch('explainshell.manager.manager')
-    @patch('explainshell.store.store')
-    def test_main_with_file(self, mock_store, mock_manager):
-        """Test main function with a file path"""
-        mock_manager.return_value.run.return_value = ([], [])
-        with patch('os.path.isdir', return_value=False):
-            main(['/test/path/to/file.gz'], "testdb", "localhost",
+@patch('explainshell.manager.manager', spec_set=True)
+@patch('explainshell.store.store', spec_set=True)
+def test_main_with_directory(mock_store, mock_manager):
+    """Test main function with a directory path"""
+    mock_manager.return_value.run.return_value = ([], [])
+    with patch('os.path.isdir', return_value=True):
+        with patch('glob.glob', return_value=['/test/path/to/file.gz']):
+            main(['/test/path'], "testdb", "localhost",
                  False, False, False)
-            self.assertTrue(mock_manager.called)
-
-    def test_main_block(self):
-        """Test the __main__ block can be imported without errors"""
-        # Simple test that the module can be imported and has the main block
-        import explainshell.manager
-
-        # Verify the module has the expected attributes
-        self.assertTrue(hasattr(explainshell.manager, 'main'))
-        self.assertTrue(hasattr(explainshell.manager, 'manager'))
-
-        # Test passes if no import errors occur
-        self.assertTrue(True)
-
-
-if __name__ == '__main__':
-    unittest.main()
+            assert mock_manager.called
+
+
+@patch('explainshell.manager.manager', spec_set=True)
+@patch('explainshell.store.store', spec_set=True)
+def test_main_with_file(mock_store, mock_manager):
+    """Test main function with a file path"""
+    mock_manager.return_value.run.return_value = ([], [])
+    with patch('os.path.isdir', return_value=False):
+        main(['/test/path/to/file.gz'], "testdb", "localhost",
+             False, False, False)
+        assert mock_manager.called
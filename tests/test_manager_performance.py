@@ -1,358 +1,348 @@
-import unittest
+import collections
+import functools
+import gc
+import itertools
+import platform
 import time
+import weakref
 from unittest.mock import Mock, patch
-import tempfile
 
-from explainshell import manager
+import pytest
 
+from explainshell import errors, manager, store
 
-class TestManagerPerformance(unittest.TestCase):
-    """Performance and stress tests for manager.py"""
 
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
+mockedmanager = collections.namedtuple("mockedmanager", "mgr store manpage")
+
+# manpage paths handed to manager, built once for the whole module
+FILES_10 = tuple(f"test{i}.1.gz" for i in range(10))
+FILES_100 = tuple(f"test{i}.1.gz" for i in range(100))
+FILES_1000 = tuple(f"test{i}.1.gz" for i in range(1000))
+SET_100 = frozenset(FILES_100)
+SET_1000 = frozenset(FILES_1000)
+SET_10 = frozenset(FILES_10)
+# five good manpages and five that fail to read
+SET_RECOVERY = frozenset(
+    FILES_10[:5] + tuple(f"fail{i}.1.gz" for i in range(5))
+)
+
+
+class fakeparagraph(object):
+    """a paragraph stand-in carrying only what manager, options.extract and
+    the fixers read, so building thousands of them stays cheap"""
+
+    __slots__ = ("idx", "is_option", "section", "_text")
+
+    def __init__(self, idx=0, is_option=True, section="", text=""):
+        self.idx = idx
+        self.is_option = is_option
+        self.section = section
+        self._text = text
+
+    def cleantext(self):
+        return self._text
+
+
+class virtualclock(object):
+    """perf_counter_ns plus simulated delays, so a test can model a slow
+    collaborator without parking the thread in a real sleep"""
+
+    def __init__(self):
+        self.offset = 0
+
+    def sleep_ns(self, ns):
+        self.offset += ns
+
+    def perf_counter_ns(self):
+        return time.perf_counter_ns() + self.offset
+
 
-    def tearDown(self):
-        import shutil
+# paragraphs built once and lent out to the tests that need lots of them
+_PARA_POOL = [fakeparagraph(idx=i) for i in range(1024)]
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
 
-    def test_manager_with_large_file_list(self):
-        """Test manager performance with large number of files"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
+def _acquireparagraphs(n):
+    """take n paragraphs from the pool, topping it up first if it's short"""
+    if len(_PARA_POOL) < n:
+        _PARA_POOL.extend(
+            fakeparagraph() for _ in range(max(n - len(_PARA_POOL), 256))
+        )
+    return [_PARA_POOL.pop() for _ in range(n)]
 
-            # Create a large list of file paths
-            large_file_list = [f"test{i}.1.gz" for i in range(100)]
 
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
+def _releaseparagraphs(paragraphs):
+    _PARA_POOL.extend(paragraphs)
 
-            start_time = time.time()
-            mgr = manager.manager("localhost", "testdb", set(large_file_list))
-            init_time = time.time() - start_time
 
-            # Initialization should be fast even with many files
-            self.assertEqual(len(mgr.paths), 100)
-            self.assertLess(
-                init_time, 1.0, "Manager initialization took too long"
-            )
+def _mockmanpage(name, shortpath):
+    """a manpage.manpage stand-in limited to what manager.run reads before
+    handing off to process"""
+    mp = Mock(spec_set=["name", "shortpath", "aliases"])
+    mp.configure_mock(name=name, shortpath=shortpath, aliases=[])
+    return mp
+
+
+def _insequence(results):
+    """a side_effect returning results in order and raising the ones that
+    are exceptions, without Mock's own iterator wrapping"""
+    it = iter(results)
+
+    def side_effect(*args, **kwargs):
+        r = next(it)
+        if isinstance(r, BaseException):
+            raise r
+        return r
+
+    return side_effect
+
+
+@functools.lru_cache(maxsize=8)
+def _make_names(base, subs):
+    """store.names() rows for base commands cmdN, each with subs
+    multicommand children cmdN-subM; findmulticommands only reads them, so
+    the same tuple is safe to share between tests"""
+    idfmt, cmdfmt = "id{}_{}".format, "cmd{}-sub{}".format
+    return tuple(itertools.chain(
+        ((f"id{i}", f"cmd{i}") for i in range(base)),
+        ((idfmt(i, j), cmdfmt(i, j))
+         for i, j in itertools.product(range(base), range(subs))),
+    ))
+
+
+@pytest.fixture(scope="module")
+def manpage_class():
+    """manager's manpage class, patched once for the module"""
+    with patch("explainshell.manager.manpage.manpage") as manpage_cls:
+        yield manpage_cls
+
+
+@pytest.fixture
+def mocked_manager(mgr, manpage_class):
+    """a per-test copy of the module's manager with a fresh spec'd store,
+    plus a clean manpage class mock"""
+    manpage_class.reset_mock(return_value=True, side_effect=True)
+    return mockedmanager(mgr, mgr.store, manpage_class)
+
+
+class TestManagerPerformance:
+    """Performance and stress tests for manager.py"""
 
-    def test_findmulticommands_with_many_commands(self):
+    # time budgets, in nanoseconds of time.perf_counter_ns()
+    TIMEOUT_INIT_NS = {100: 1_000_000_000, 1000: 10_000_000_000}
+    TIMEOUT_FINDMULTI_NS = 2_000_000_000
+    TIMEOUT_RUN_NS = 1_000_000_000
+    TIMEOUT_REPEAT_NS = 1_000_000_000
+    TIMEOUT_CLEANUP_NS = 100_000_000
+    TIMEOUT_RECOVERY_NS = 1_000_000_000
+
+    @pytest.mark.parametrize(
+        "paths",
+        [SET_100, pytest.param(SET_1000, marks=pytest.mark.slow)],
+        ids=["100", "1000"],
+    )
+    def test_init_scales(self, mocked_manager_deps, paths):
+        """Test manager initialization with large numbers of files"""
+        start_time = time.perf_counter_ns()
+        mgr = manager.manager("localhost", "testdb", paths)
+        init_time = time.perf_counter_ns() - start_time
+
+        # Initialization should be fast even with many files
+        assert len(mgr.paths) == len(paths)
+        assert init_time < self.TIMEOUT_INIT_NS[len(paths)], \
+            "Manager initialization took too long"
+
+    def test_findmulticommands_with_many_commands(self, mocked_manager):
         """Test findmulticommands performance with many commands"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Create many commands with potential multicommands
-            names_data = []
-            names_data = [(f"id{i}", f"cmd{i}") for i in range(50)] + \
-                [(f"id{i + 50}", f"cmd{i}-sub") for i in range(50)]
-            mock_store_instance.names.return_value = names_data
-            mock_store_instance.mappings.return_value = []
-
-            mgr = manager.manager("localhost", "testdb", set())
-
-            start_time = time.time()
-            mappings, multicommands = mgr.findmulticommands()
-            execution_time = time.time() - start_time
-
-            # Should complete in reasonable time
-            self.assertLess(
-                execution_time, 2.0, "findmulticommands took too long"
-            )
-            self.assertEqual(len(mappings), 50)  # Should find 50 multicommands
-
-    def test_run_with_concurrent_processing_simulation(self):
+        mgr, mock_store_instance, _ = mocked_manager
+
+        # Create many commands with potential multicommands
+        mock_store_instance.names.return_value = _make_names(50, 1)
+        mock_store_instance.mappings.return_value = []
+
+        start_time = time.perf_counter_ns()
+        mappings, multicommands = mgr.findmulticommands()
+        execution_time = time.perf_counter_ns() - start_time
+
+        # Should complete in reasonable time
+        assert execution_time < self.TIMEOUT_FINDMULTI_NS, \
+            "findmulticommands took too long"
+        assert len(mappings) == 50  # Should find 50 multicommands
+
+    def test_run_with_concurrent_processing_simulation(self, mocked_manager):
         """Test run method behavior under simulated concurrent load"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class,
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Simulate slow database operations
-            def slow_findmanpage(name):
-                time.sleep(0.01)  # 10ms delay
-                from explainshell.errors import ProgramDoesNotExist
-
-                raise ProgramDoesNotExist(name)
-
-            mock_store_instance.findmanpage.side_effect = slow_findmanpage
-
-            # Create multiple manpages
-            file_list = [f"test{i}.1.gz" for i in range(10)]
-
-            def create_mock_manpage(i, filename):
-                mock_mp = Mock()
-                mock_mp.name = f"test{i}"
-                mock_mp.shortpath = filename
-                mock_mp.aliases = []
-                return mock_mp
-
-            mock_manpages = [
-                create_mock_manpage(i, filename)
-                for i, filename in enumerate(file_list)
-            ]
-
-            mock_manpage_class.side_effect = mock_manpages
-
-            mgr = manager.manager("localhost", "testdb", set(file_list))
-
-            # Mock store.names() for findmulticommands
-            mock_store_instance.names.return_value = []
-            mock_store_instance.mappings.return_value = []
-
-            # Mock the process method to return quickly
-            def quick_process(ctx):
-                return ctx.manpage
-
-            with patch.object(mgr, "process", side_effect=quick_process):
-                start_time = time.time()
-                added, exists = mgr.run()
-                execution_time = time.time() - start_time
-
-                # Should process all files
-                self.assertEqual(len(added), 10)
-                self.assertEqual(len(exists), 0)
-
-                # Should complete in reasonable time despite delays
-                self.assertLess(
-                    execution_time, 1.0, "Processing took too long"
-                )
-
-    def test_memory_usage_with_large_manpages(self):
+        mgr, mock_store_instance, mock_manpage_class = mocked_manager
+
+        clock = virtualclock()
+
+        # Simulate slow database operations
+        def slow_findmanpage(name):
+            clock.sleep_ns(10_000_000)  # 10ms delay
+            raise errors.ProgramDoesNotExist(name)
+
+        mock_store_instance.findmanpage.side_effect = slow_findmanpage
+
+        # Create multiple manpages
+        mock_manpages = [
+            _mockmanpage(f"test{i}", filename)
+            for i, filename in enumerate(FILES_10)
+        ]
+
+        mock_manpage_class.side_effect = _insequence(mock_manpages)
+        mgr.paths = SET_10
+
+        # Mock store.names() for findmulticommands
+        mock_store_instance.names.return_value = []
+        mock_store_instance.mappings.return_value = []
+
+        # Mock the process method to return quickly
+        def quick_process(ctx):
+            return ctx.manpage
+
+        with patch.object(mgr, "process", side_effect=quick_process):
+            start_time = clock.perf_counter_ns()
+            added, exists = mgr.run()
+            execution_time = clock.perf_counter_ns() - start_time
+
+            # Should process all files
+            assert len(added) == 10
+            assert len(exists) == 0
+
+            # Should complete in reasonable time despite delays
+            assert execution_time < self.TIMEOUT_RUN_NS, \
+                "Processing took too long"
+
+    def test_memory_usage_with_large_manpages(self, mocked_manager):
         """Test memory efficiency with large manpage objects"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Create a manpage with many paragraphs
-            mock_manpage = Mock()
-            mock_manpage.name = "large_test"
-            mock_manpage.paragraphs = [
-                Mock() for _ in range(1000)
-            ]  # Large number of paragraphs
-            mock_manpage.options = [Mock() for _ in range(100)]  # Many options
-
-            mgr = manager.manager("localhost", "testdb", set())
+        mgr = mocked_manager.mgr
+
+        # Create a manpage with many paragraphs
+        mock_manpage = Mock(spec=store.manpage)
+        mock_manpage.name = "large_test"
+        # Large number of paragraphs, many options
+        mock_manpage.paragraphs = _acquireparagraphs(1000)
+        mock_manpage.options = _acquireparagraphs(100)
+        try:
             ctx = mgr.ctx(mock_manpage)
 
             # Should handle large objects without issues
-            self.assertEqual(ctx.name, "large_test")
-            self.assertEqual(len(ctx.manpage.paragraphs), 1000)
+            assert ctx.name == "large_test"
+            assert len(ctx.manpage.paragraphs) == 1000
+        finally:
+            _releaseparagraphs(mock_manpage.paragraphs)
+            _releaseparagraphs(mock_manpage.options)
 
-    def test_repeated_operations_performance(self):
+    def test_repeated_operations_performance(self, mocked_manager):
         """Test performance of repeated manager operations"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch("explainshell.manager.classifier.classifier"),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            manager.manager("localhost", "testdb", set())
-
-            # Create a mock manpage
-            mock_manpage = Mock()
-            mock_manpage.name = "test"
-            # Create mock paragraphs with cleantext method
-
-            def create_mock_paragraph(i):
-                p = Mock()
-                p.cleantext.return_value = f"test paragraph {i}"
-                p.is_option = True
-                p.idx = i
-                return p
-
-            mock_paragraphs = [create_mock_paragraph(i) for i in range(10)]
-            mock_manpage.paragraphs = mock_paragraphs
-            mock_manpage.options = []
-            mock_manpage.aliases = []
-
-            mock_store_instance.updatemanpage.return_value = mock_manpage
-
-            # Perform repeated edit operations
-            start_time = time.time()
-            mgr = manager.manager("localhost", "testdb", set())
-            results = [mgr.edit(mock_manpage) for _ in range(50)]
-            execution_time = time.time() - start_time
-
-            # Verify all operations completed
-            self.assertEqual(len(results), 50)
-
-            # Should complete repeated operations quickly
-            self.assertLess(
-                execution_time, 1.0, "Repeated operations took too long"
-            )
-
-    def test_manager_cleanup_performance(self):
+        mgr, mock_store_instance, _ = mocked_manager
+
+        # Create a mock manpage
+        mock_manpage = Mock(spec=store.manpage)
+        mock_manpage.name = "test"
+        # paragraphjoiner expects option paragraphs in increasing idx
+        # order; these carry per-test text, so they stay out of the pool
+        mock_manpage.paragraphs = [
+            fakeparagraph(idx=i, text=f"test paragraph {i}")
+            for i in range(10)
+        ]
+        mock_manpage.options = []
+        mock_manpage.aliases = []
+
+        mock_store_instance.updatemanpage.return_value = mock_manpage
+
+        # Perform repeated edit operations
+        start_time = time.perf_counter_ns()
+        results = [mgr.edit(mock_manpage) for _ in range(50)]
+        execution_time = time.perf_counter_ns() - start_time
+
+        # Verify all operations completed
+        assert len(results) == 50
+
+        # Should complete repeated operations quickly
+        assert execution_time < self.TIMEOUT_REPEAT_NS, \
+            "Repeated operations took too long"
+
+    @pytest.mark.skipif(
+        platform.python_implementation() != "CPython",
+        reason="relies on refcounting freeing the manager on del",
+    )
+    def test_manager_cleanup_performance(self, mocked_manager_deps):
         """Test manager cleanup and resource deallocation"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
+        # Create manager with many paths
+        mgr = manager.manager("localhost", "testdb", SET_100)
+        finalized = []
+        weakref.finalize(
+            mgr, lambda: finalized.append(time.perf_counter_ns())
+        )
+
+        # Simulate cleanup
+        start_time = time.perf_counter_ns()
+        del mgr
+        gc.collect()
+
+        # Cleanup should happen, and fast
+        assert finalized, "manager was never freed"
+        assert finalized[0] - start_time < self.TIMEOUT_CLEANUP_NS, \
+            "Cleanup took too long"
+
+    def test_error_recovery_performance(self, mocked_manager):
+        """Test performance when recovering from errors"""
+        mgr, mock_store_instance, mock_manpage_class = mocked_manager
 
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
+        # Create separate mock objects for successful and failing cases
+        success_mocks = [
+            _mockmanpage(f"test{i}", f"test{i}.1.gz") for i in range(5)
+        ]
+        fail_exceptions = [
+            errors.EmptyManpage(f"fail{i}.1.gz") for i in range(5)
+        ]
 
-            # Create manager with many paths
-            large_file_list = [f"test{i}.1.gz" for i in range(100)]
-            mgr = manager.manager("localhost", "testdb", set(large_file_list))
+        mock_responses = success_mocks + fail_exceptions
+        mock_manpage_class.side_effect = _insequence(mock_responses)
 
-            # Simulate cleanup
-            start_time = time.time()
-            del mgr
-            cleanup_time = time.time() - start_time
+        mock_store_instance.findmanpage.side_effect = (
+            errors.ProgramDoesNotExist
+        )
 
-            # Cleanup should be fast
-            self.assertLess(cleanup_time, 0.1, "Cleanup took too long")
+        # Mix of good and bad files
+        mgr.paths = SET_RECOVERY
 
-    def test_error_recovery_performance(self):
-        """Test performance when recovering from errors"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-            patch(
-                "explainshell.manager.manpage.manpage"
-            ) as mock_manpage_class,
-        ):
-
-            # Create separate mock objects for successful and failing cases
-            from explainshell.errors import EmptyManpage
-
-            def create_success_mock(path):
-                mock_mp = Mock()
-                mock_mp.name = path.replace(".1.gz", "")
-                mock_mp.shortpath = path
-                mock_mp.aliases = []
-                return mock_mp
-
-            # Create mock responses for each file
-            success_mocks = [
-                create_success_mock(f"test{i}.1.gz") for i in range(5)
-            ]
-            fail_exceptions = [
-                EmptyManpage(f"fail{i}.1.gz") for i in range(5)
-            ]
-
-            mock_responses = success_mocks + fail_exceptions
-            mock_manpage_class.side_effect = mock_responses
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            def mock_findmanpage(name):
-                from explainshell.errors import ProgramDoesNotExist
-
-                raise ProgramDoesNotExist(name)
-
-            mock_store_instance.findmanpage.side_effect = mock_findmanpage
-
-            # Mix of good and bad files (order matches mock_responses)
-            file_list = [f"test{i}.1.gz" for i in range(5)] + [
-                f"fail{i}.1.gz" for i in range(5)
-            ]
-
-            mgr = manager.manager("localhost", "testdb", set(file_list))
-
-            # Mock store.names() for findmulticommands
-            mock_store_instance.names.return_value = []
-            mock_store_instance.mappings.return_value = []
-
-            with patch.object(mgr, "process", return_value=Mock()):
-                start_time = time.time()
-                added, exists = mgr.run()
-                execution_time = time.time() - start_time
-
-                # Should handle errors gracefully and continue
-                self.assertEqual(len(added), 5)  # Only successful ones
-                self.assertEqual(len(exists), 0)
-
-                # Should not be significantly slower due to errors
-                self.assertLess(
-                    execution_time, 1.0, "Error recovery took too long"
-                )
-
-
-class TestManagerStress(unittest.TestCase):
-    """Stress tests for manager.py"""
+        # Mock store.names() for findmulticommands
+        mock_store_instance.names.return_value = []
+        mock_store_instance.mappings.return_value = []
+
+        with patch.object(mgr, "process", return_value=Mock()):
+            start_time = time.perf_counter_ns()
+            added, exists = mgr.run()
+            execution_time = time.perf_counter_ns() - start_time
 
-    def test_stress_manager_initialization(self):
-        """Stress test manager initialization with extreme parameters"""
-        with (
-            patch("explainshell.manager.store.store"),
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
+            # Should handle errors gracefully and continue
+            assert len(added) == 5  # Only successful ones
+            assert len(exists) == 0
 
-            # Very large file list
-            huge_file_list = [f"test{i}.1.gz" for i in range(1000)]
+            # Should not be significantly slower due to errors
+            assert execution_time < self.TIMEOUT_RECOVERY_NS, \
+                "Error recovery took too long"
 
-            mgr = manager.manager("localhost", "testdb", set(huge_file_list))
-            self.assertEqual(len(mgr.paths), 1000)
 
-    def test_stress_findmulticommands(self):
+@pytest.mark.slow
+class TestManagerStress:
+    """Stress tests for manager.py"""
+
+    TIMEOUT_STRESS_NS = 10_000_000_000
+
+    def test_stress_findmulticommands(self, mocked_manager):
         """Stress test findmulticommands with extreme data"""
-        with (
-            patch("explainshell.manager.store.store") as mock_store_class,
-            patch(
-                "explainshell.manager.classifier.classifier"
-            ),
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            # Create extreme number of commands
-            base_commands = [(f"id{i}", f"cmd{i}") for i in range(500)]
-            sub_commands = [(f"id{i}_{j}", f"cmd{i}-sub{j}")
-                            for i in range(500) for j in range(5)]
-            names_data = base_commands + sub_commands
-            mock_store_instance.names.return_value = names_data
-            mock_store_instance.mappings.return_value = []
-
-            mgr = manager.manager("localhost", "testdb", set())
-
-            start_time = time.time()
-            mappings, multicommands = mgr.findmulticommands()
-            execution_time = time.time() - start_time
-
-            # Should complete even with extreme data
-            self.assertLess(
-                execution_time, 10.0, "Stress test took too long"
-            )
-            self.assertEqual(len(mappings), 2500)  # 500 * 5 subcommands
-
-
-if __name__ == "__main__":
-    unittest.main()
+        mgr, mock_store_instance, _ = mocked_manager
+
+        # Create extreme number of commands
+        mock_store_instance.names.return_value = _make_names(500, 5)
+        mock_store_instance.mappings.return_value = []
+
+        start_time = time.perf_counter_ns()
+        mappings, multicommands = mgr.findmulticommands()
+        execution_time = time.perf_counter_ns() - start_time
+
+        # Should complete even with extreme data
+        assert execution_time < self.TIMEOUT_STRESS_NS, \
+            "Stress test took too long"
+        assert len(mappings) == 2500  # 500 * 5 subcommands
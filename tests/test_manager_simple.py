@@ -1,37 +1,52 @@
 import unittest
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import NonCallableMock, patch
 
-from explainshell import manager, errors
+from explainshell import manager, errors, store
+from explainshell.algo import classifier
+
+# the real classes, so the instance mocks reject attributes they don't have
+_storespec = store.store
+_classifierspec = classifier.classifier
 
 
 class TestManagerSimple(unittest.TestCase):
     """Simplified manager tests focusing on core functionality"""
 
+    def setUp(self):
+        # swap only the store and classifier classes manager instantiates
+        self.mock_store_class = self._start(
+            patch("explainshell.manager.store.store", spec_set=True)
+        )
+        self.mock_classifier_class = self._start(
+            patch("explainshell.manager.classifier.classifier", spec_set=True)
+        )
+        self.mock_store_instance = NonCallableMock(spec=_storespec)
+        self.mock_store_class.return_value = self.mock_store_instance
+        self.mock_classifier_class.return_value = NonCallableMock(
+            spec=_classifierspec
+        )
+
+    def _start(self, patcher):
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
     def test_manager_initialization_basic(self):
         """Test basic manager initialization"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ) as mock_classifier_class:
+        classifier_instance = self.mock_classifier_class.return_value
 
-            mock_store_instance = Mock()
-            mock_classifier_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-            mock_classifier_class.return_value = mock_classifier_instance
+        mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
 
-            mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
-
-            self.assertEqual(mgr.paths, {"test.1.gz"})
-            self.assertFalse(mgr.overwrite)
-            mock_classifier_instance.train.assert_called_once()
+        self.assertEqual(mgr.paths, {"test.1.gz"})
+        self.assertFalse(mgr.overwrite)
+        classifier_instance.train.assert_called_once()
 
     def test_managerctx_creation_basic(self):
         """Test basic managerctx creation"""
-        mock_classifier = Mock()
-        mock_store = Mock()
-        mock_manpage = Mock()
-        mock_manpage.name = "test"
+        # managerctx only stores these, it never calls them
+        mock_classifier = NonCallableMock(spec=_classifierspec)
+        mock_store = NonCallableMock(spec=_storespec)
+        mock_manpage = SimpleNamespace(name="test")
 
         ctx = manager.managerctx(mock_classifier, mock_store, mock_manpage)
 
@@ -40,137 +55,83 @@ class TestManagerSimple(unittest.TestCase):
         self.assertEqual(ctx.manpage, mock_manpage)
         self.assertEqual(ctx.name, "test")
 
-    def test_run_empty_paths(self):
-        """Test run with empty paths"""
-        with patch(
-            "explainshell.manager.store.store"
-        ), patch(
-            "explainshell.manager.classifier.classifier"
-        ):
-
-            mgr = manager.manager("localhost", "testdb", set())
-            added, exists = mgr.run()
-
-            self.assertEqual(added, [])
-            self.assertEqual(exists, [])
-
-    def test_findmulticommands_no_commands(self):
-        """Test findmulticommands with no commands"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ):
+    def test_manager_empty_state(self):
+        """Test run and findmulticommands with no paths and no commands"""
+        mock_store_instance = self.mock_store_instance
+        mock_store_instance.names.return_value = []
+        mock_store_instance.mappings.return_value = []
 
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-            mock_store_instance.names.return_value = []
-            mock_store_instance.mappings.return_value = []
+        mgr = manager.manager("localhost", "testdb", set())
 
-            mgr = manager.manager("localhost", "testdb", set())
-            mappings, multicommands = mgr.findmulticommands()
+        added, exists = mgr.run()
+        self.assertEqual(added, [])
+        self.assertEqual(exists, [])
 
-            self.assertEqual(mappings, [])
-            self.assertEqual(multicommands, {})
+        mappings, multicommands = mgr.findmulticommands()
+        self.assertEqual(mappings, [])
+        self.assertEqual(multicommands, {})
 
     def test_findmulticommands_simple_case(self):
         """Test findmulticommands with simple case"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
+        mock_store_instance = self.mock_store_instance
+        mock_store_instance.names.return_value = [
+            ("id1", "git"),
+            ("id2", "git-rebase"),
+        ]
+        mock_store_instance.mappings.return_value = []
 
-            mock_store_instance.names.return_value = [
-                ("id1", "git"),
-                ("id2", "git-rebase"),
-            ]
-            mock_store_instance.mappings.return_value = []
+        mgr = manager.manager("localhost", "testdb", set())
+        mappings, multicommands = mgr.findmulticommands()
 
-            mgr = manager.manager("localhost", "testdb", set())
-            mappings, multicommands = mgr.findmulticommands()
+        self.assertEqual(len(mappings), 1)
+        self.assertEqual(mappings[0], ("git rebase", "id2"))
+        self.assertEqual(multicommands, {"git": "id1"})
 
-            self.assertEqual(len(mappings), 1)
-            self.assertEqual(mappings[0], ("git rebase", "id2"))
-            self.assertEqual(multicommands, {"git": "id1"})
-
-    @patch("explainshell.manager.input")
-    def test_main_verify_success(self, mock_input):
+    def test_main_verify_success(self):
         """Test main function with verify option - success case"""
-        with patch("explainshell.manager.store.store") as mock_store_class:
-            mock_store_instance = Mock()
-            mock_store_instance.verify.return_value = (
-                True,
-                [],
-                [],
-            )  # verify() returns tuple
-            mock_store_class.return_value = mock_store_instance
-
-            result = manager.main(
-                [], "testdb", "localhost", False, False, True
-            )
+        self.mock_store_instance.verify.return_value = (
+            True,
+            [],
+            [],
+        )  # verify() returns tuple
 
-            self.assertEqual(result, 0)
+        result = manager.main([], "testdb", "localhost", False, False, True)
 
-    @patch("explainshell.manager.input")
-    def test_main_verify_failure(self, mock_input):
+        self.assertEqual(result, 0)
+
+    def test_main_verify_failure(self):
         """Test main function with verify option - failure case"""
-        with patch("explainshell.manager.store.store") as mock_store_class:
-            mock_store_instance = Mock()
-            mock_store_instance.verify.return_value = (
-                False,
-                [],
-                [],
-            )  # verify() returns tuple
-            mock_store_class.return_value = mock_store_instance
-
-            result = manager.main(
-                [], "testdb", "localhost", False, False, True
-            )
+        self.mock_store_instance.verify.return_value = (
+            False,
+            [],
+            [],
+        )  # verify() returns tuple
+
+        result = manager.main([], "testdb", "localhost", False, False, True)
 
-            self.assertEqual(result, 1)
+        self.assertEqual(result, 1)
 
     def test_manager_with_drop_flag(self):
         """Test manager initialization with drop flag"""
-        with patch(
-            "explainshell.manager.store.store"
-        ) as mock_store_class, patch(
-            "explainshell.manager.classifier.classifier"
-        ):
-
-            mock_store_instance = Mock()
-            mock_store_class.return_value = mock_store_instance
-
-            manager.manager("localhost", "testdb", set(), drop=True)
+        manager.manager("localhost", "testdb", set(), drop=True)
 
-            mock_store_instance.drop.assert_called_once_with(True)
+        self.mock_store_instance.drop.assert_called_once_with(True)
 
     def test_manager_with_overwrite_flag(self):
         """Test manager initialization with overwrite flag"""
-        with patch(
-            "explainshell.manager.store.store"
-        ), patch(
-            "explainshell.manager.classifier.classifier"
-        ):
-
-            mgr = manager.manager("localhost", "testdb", set(), overwrite=True)
+        mgr = manager.manager("localhost", "testdb", set(), overwrite=True)
 
-            self.assertTrue(mgr.overwrite)
+        self.assertTrue(mgr.overwrite)
 
     def test_run_with_empty_manpage_exception(self):
         """Test run method handling EmptyManpage exception"""
         with patch(
-            "explainshell.manager.store.store"
-        ), patch(
-            "explainshell.manager.classifier.classifier"
-        ), patch(
             "explainshell.manager.manpage.manpage"
         ) as mock_manpage_class:
 
-            mock_manpage_class.side_effect = errors.EmptyManpage("test.1.gz")
+            mock_manpage_class.side_effect = errors.EmptyManpage(
+                "test.1.gz"
+            )
 
             mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
             added, exists = mgr.run()
@@ -181,14 +142,10 @@ class TestManagerSimple(unittest.TestCase):
     def test_run_with_keyboard_interrupt(self):
         """Test run method handling KeyboardInterrupt"""
         with patch(
-            "explainshell.manager.store.store"
-        ), patch(
-            "explainshell.manager.classifier.classifier"
-        ), patch(
             "explainshell.manager.manpage.manpage"
         ) as mock_manpage_class:
 
-            mock_manpage_class.side_effect = KeyboardInterrupt()
+            mock_manpage_class.side_effect = KeyboardInterrupt
 
             mgr = manager.manager("localhost", "testdb", {"test.1.gz"})
 
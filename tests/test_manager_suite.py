@@ -1,48 +1,59 @@
+import functools
+import glob
+import importlib.util
+import io
+import os
+import subprocess
 import unittest
 import sys
 
+_TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
 
+
+def _load(name):
+    """Import the sibling test module name"""
+    return importlib.import_module(f".{name}", package=__package__)
+
+
+@functools.lru_cache(maxsize=1)
 def create_manager_test_suite():
     """Create a comprehensive test suite for manager.py"""
-    # Import test classes using relative imports
-    from .test_manager_expanded import TestManagerExpanded
-    from .test_manager_edge_cases import TestManagerEdgeCases
-    from .test_manager_performance import (
-        TestManagerPerformance,
-        TestManagerStress,
-    )
-    from .test_comprehensive import TestComprehensive
-    from .test_matcher import test_matcher
-    from .test_views import TestViews, TestViewsIntegration
-
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
-    # Core functionality tests
-    suite.addTest(loader.loadTestsFromTestCase(TestComprehensive))
-    suite.addTest(loader.loadTestsFromTestCase(test_matcher))
-    suite.addTest(loader.loadTestsFromTestCase(TestViews))
-    suite.addTest(loader.loadTestsFromTestCase(TestViewsIntegration))
-
-    # Manager-specific tests
-    suite.addTest(loader.loadTestsFromTestCase(TestManagerExpanded))
-    suite.addTest(loader.loadTestsFromTestCase(TestManagerEdgeCases))
-    suite.addTest(loader.loadTestsFromTestCase(TestManagerPerformance))
+    def add(module_name, *class_names):
+        # import each module only when its tests are about to be added
+        module = _load(module_name)
+        for name in class_names:
+            suite.addTest(loader.loadTestsFromTestCase(getattr(module, name)))
 
-    # Optional stress tests
-    if "--include-stress" in sys.argv:
-        suite.addTest(loader.loadTestsFromTestCase(TestManagerStress))
+    # Core functionality tests
+    add("test_comprehensive", "TestComprehensive")
+    add("test_matcher", "test_matcher")
+    add("test_views", "TestViews", "TestViewsIntegration")
+
+    # Manager-specific tests; the expanded, edge-case and performance
+    # modules are pytest-style and run through make test-manager-full
+    add("test_manager_simple", "TestManagerSimple")
+    add(
+        "test_manager_comprehensive",
+        "TestManagerComprehensive",
+        "TestManagerAdditionalCoverage",
+        "TestManagerFinalCoverage",
+    )
 
     return suite
 
 
+@functools.lru_cache(maxsize=1)
 def create_full_test_suite():
     """Create comprehensive test suite for entire explainshell package"""
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
 
-    # Add manager test suite
-    suite.addTest(create_manager_test_suite())
+    # Add manager test suite; a suite empties itself as it runs, so build
+    # a new one rather than sharing the cached manager suite
+    suite.addTest(create_manager_test_suite.__wrapped__())
 
     # Add other test modules if they exist
     test_modules = [
@@ -65,26 +76,58 @@ def create_full_test_suite():
     return suite
 
 
+def _manager_test_paths():
+    """The manager and manpage test modules run-manager hands to pytest"""
+    return sorted(
+        glob.glob(os.path.join(_TESTS_DIR, "test_manager_*.py"))
+        + glob.glob(os.path.join(_TESTS_DIR, "test_manpage*.py"))
+    )
+
+
 def run_manager_tests():
-    """Run all manager tests with detailed output"""
-    suite = create_manager_test_suite()
-    return _run_test_suite(suite, "Manager Test Suite")
+    """Run all manager and manpage tests under pytest"""
+    return _run_pytest(_manager_test_paths())
 
 
 def run_full_tests():
-    """Run complete test suite with detailed output"""
-    suite = create_full_test_suite()
-    return _run_test_suite(suite, "Complete Test Suite")
+    """Run the complete test directory under pytest"""
+    return _run_pytest([_TESTS_DIR])
+
+
+def run_legacy_manager_tests():
+    """Run the unittest manager suite with detailed output"""
+    # running a suite empties it, so don't hand out the cached one
+    suite = create_manager_test_suite.__wrapped__()
+    return _run_test_suite(suite, "Manager Test Suite")
+
+
+def _run_pytest(paths):
+    """Run paths under pytest, sharded across cores by file when
+    pytest-xdist is installed"""
+    args = [sys.executable, "-m", "pytest"]
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist", "loadfile"]
+    if "--include-stress" not in sys.argv:
+        args += ["-m", "not slow"]
+    if "--failfast" in sys.argv:
+        args.append("-x")
+    args += paths
+    result = subprocess.run(args, cwd=os.path.dirname(_TESTS_DIR))
+    return result.returncode == 0
 
 
 def _run_test_suite(suite, suite_name):
     """Helper to run test suite with consistent output"""
+    buffered = "--buffer" in sys.argv
+    # with --buffer, hold the runner's own report back too and write it
+    # out in one piece once the suite is done
+    stream = io.StringIO() if buffered else sys.stdout
     runner = unittest.TextTestRunner(
         verbosity=2,
-        stream=sys.stdout,
+        stream=stream,
         descriptions=True,
         failfast="--failfast" in sys.argv,
-        buffer="--buffer" in sys.argv,
+        buffer=buffered,
     )
 
     print(f"\n{'='*60}")
@@ -94,34 +137,41 @@ def _run_test_suite(suite, suite_name):
     result = runner.run(suite)
 
     # Print detailed summary
-    print(f"\n{'='*60}")
-    print(f"{suite_name} Summary")
-    print(f"{'='*60}")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(
-        f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
+    out = io.StringIO()
+    if buffered:
+        out.write(stream.getvalue())
+    print(f"\n{'='*60}", file=out)
+    print(f"{suite_name} Summary", file=out)
+    print(f"{'='*60}", file=out)
+    print(f"Tests run: {result.testsRun}", file=out)
+    print(f"Failures: {len(result.failures)}", file=out)
+    print(f"Errors: {len(result.errors)}", file=out)
+    print(f"Skipped: {len(result.skipped)}", file=out)
 
     success_rate = ((result.testsRun - len(
         result.failures) - len(result.errors)
     ) / result.testsRun * 100) if result.testsRun > 0 else 0
-    print(f"Success rate: {success_rate:.1f}%")
+    print(f"Success rate: {success_rate:.1f}%", file=out)
 
-    if result.failures:
-        print(f"\nFailures ({len(result.failures)}):")
-        for i, (test, traceback) in enumerate(result.failures, 1):
-            print(f"  {i}. {test}")
+    # a clean run has nothing to list
+    if not result.wasSuccessful() or result.skipped:
+        if result.failures:
+            print(f"\nFailures ({len(result.failures)}):", file=out)
+            for i, (test, traceback) in enumerate(result.failures, 1):
+                print(f"  {i}. {test}", file=out)
 
-    if result.errors:
-        print(f"\nErrors ({len(result.errors)}):")
-        for i, (test, traceback) in enumerate(result.errors, 1):
-            print(f"  {i}. {test}")
+        if result.errors:
+            print(f"\nErrors ({len(result.errors)}):", file=out)
+            for i, (test, traceback) in enumerate(result.errors, 1):
+                print(f"  {i}. {test}", file=out)
 
-    if result.skipped and hasattr(result, 'skipped'):
-        print(f"\nSkipped ({len(result.skipped)}):")
-        for i, (test, reason) in enumerate(result.skipped, 1):
-            print(f"  {i}. {test} - {reason}")
+        if result.skipped:
+            print(f"\nSkipped ({len(result.skipped)}):", file=out)
+            for i, (test, reason) in enumerate(result.skipped, 1):
+                print(f"  {i}. {test} - {reason}", file=out)
+
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
     return result.wasSuccessful()
 
@@ -129,54 +179,60 @@ def _run_test_suite(suite, suite_name):
 class TestManagerTestSuite(unittest.TestCase):
     """Meta-test to ensure all test modules can be imported and run"""
 
+    @classmethod
+    def setUpClass(cls):
+        # build each suite once; the tests below only inspect them
+        cls.manager_suite = create_manager_test_suite()
+        cls.full_suite = create_full_test_suite()
+        cls.mc = cls.manager_suite.countTestCases()
+        cls.fc = cls.full_suite.countTestCases()
+
     def test_manager_test_suite_creation(self):
         """Test that the manager test suite can be created"""
-        suite = create_manager_test_suite()
-        self.assertIsInstance(suite, unittest.TestSuite)
-        self.assertGreater(suite.countTestCases(), 0)
+        self.assertIsInstance(self.manager_suite, unittest.TestSuite)
+        self.assertGreater(self.mc, 0)
 
     def test_full_test_suite_creation(self):
         """Test that the full test suite can be created"""
-        suite = create_full_test_suite()
-        self.assertIsInstance(suite, unittest.TestSuite)
-        self.assertGreater(suite.countTestCases(), 0)
+        self.assertIsInstance(self.full_suite, unittest.TestSuite)
+        self.assertGreater(self.fc, 0)
 
     def test_manager_test_categories(self):
         """Test that all manager test categories are represented"""
-        suite = create_manager_test_suite()
-        total_tests = suite.countTestCases()
         self.assertGreater(
-            total_tests, 0, "Manager test suite should contain tests")
+            self.mc, 0, "Manager test suite should contain tests")
         self.assertGreaterEqual(
-            total_tests, 5, "Should have at least 5 test categories")
+            self.mc, 5, "Should have at least 5 test categories")
 
     def test_comprehensive_coverage(self):
         """Test that comprehensive test coverage is available"""
-        full_suite = create_full_test_suite()
-        manager_suite = create_manager_test_suite()
-
-        full_count = full_suite.countTestCases()
-        manager_count = manager_suite.countTestCases()
-
         # Full suite should have at least as many tests as manager suite
-        self.assertGreaterEqual(full_count, manager_count)
+        self.assertGreaterEqual(self.fc, self.mc)
 
     def test_test_discovery(self):
-        """Test that test discovery works for available modules"""
-        # Test that we can discover tests in the current package
-        loader = unittest.TestLoader()
-        discovered_suite = loader.discover('.', pattern='test_*.py')
-        self.assertIsInstance(discovered_suite, unittest.TestSuite)
+        """Test that run-manager finds every manager test module"""
+        # the pytest-style modules aren't in the unittest suites above, so
+        # this is the only check that run-manager still reaches them
+        found = {os.path.basename(p) for p in _manager_test_paths()}
+        self.assertLessEqual(
+            {
+                "test_manager_comprehensive.py",
+                "test_manager_edge_cases.py",
+                "test_manager_expanded.py",
+                "test_manager_main.py",
+                "test_manager_performance.py",
+                "test_manager_simple.py",
+                "test_manpage.py",
+            },
+            found,
+        )
 
     def test_suite_execution_modes(self):
         """Test different execution modes work"""
-        # Test basic suite creation
-        basic_suite = create_manager_test_suite()
-        self.assertGreater(basic_suite.countTestCases(), 0)
-
-        # Test full suite creation
-        full_suite = create_full_test_suite()
-        self.assertGreater(full_suite.countTestCases(), 0)
+        # the factories are cached, so each mode hands back the suite
+        # built in setUpClass
+        self.assertIs(create_manager_test_suite(), self.manager_suite)
+        self.assertIs(create_full_test_suite(), self.full_suite)
 
 
 if __name__ == "__main__":
@@ -195,7 +251,7 @@ if __name__ == "__main__":
             print("  python test_manager_suite.py              "
                   "# Run meta-tests")
             print("\nOptions:")
-            print("  --include-stress    # Include stress tests")
+            print("  --include-stress    # Include slow stress tests")
             print("  --failfast          # Stop on first failure")
             print("  --buffer            # Buffer stdout/stderr")
             sys.exit(0)
@@ -204,9 +260,12 @@ if __name__ == "__main__":
             # Run complete test suite
             success = run_full_tests()
             sys.exit(0 if success else 1)
-        elif command in ["run-manager", "run-suite"]:
+        elif command == "run-manager":
             # Run manager test suite only
             success = run_manager_tests()
             sys.exit(0 if success else 1)
+        elif command == "run-suite":
+            success = run_legacy_manager_tests()
+            sys.exit(0 if success else 1)
     # Run the meta-tests by default
     unittest.main()
@@ -8,19 +8,82 @@ from unittest.mock import patch
 
 from explainshell import manpage, errors
 
+# manpage bodies and _parsetext inputs shared by the tests below
+_HTML_FIXTURE_A = '''line1
+line2
+line3
+line4
+line5
+line6
+line7
+<p>Some content here</p>
+<p>More content</p>
+<p>Another paragraph</p>
+footer1
+footer2
+footer3'''
+
+_HTML_FIXTURE_B = '''line1
+line2
+line3
+line4
+line5
+line6
+line7
+<p>Content paragraph</p>
+<p>Another paragraph</p>
+footer1
+footer2
+footer3'''
+
+_PARSETEXT_SECTIONS = (
+    '<b>NAME</b>',
+    'program - description',
+    '',
+    '<b>SYNOPSIS</b>',
+    'program [options]',
+    '',
+    '   <b>DESCRIPTION:</b>',
+    'This is a description',
+)
+
+_PARSETEXT_BOLD_SECTION = (
+    '    <b>OPTIONS:</b>',
+    '    -v, --verbose',
+    '        Enable verbose output',
+    '',
+    'More content',
+)
+
+_PARSETEXT_HREF = (
+    '<a href="file:///usr/share/man/man1/ls.1.gz?ls(1)">ls(1)</a>',
+    'Some text with link',
+)
+
+_PARSETEXT_REPLACEMENTS = (
+    'Text with \xe2\x80\xe2\x80\x98quotes\xe2\x80\xe2\x80\x99',
+    '',  # Empty line to separate paragraphs
+    'Text with \xe2\x94\xe2\x94\x82 pipe',
+    '',  # Empty line to separate paragraphs
+    'Text with \xc2\xb7 bullet',
+)
+
 
 class TestManpageCoverage(unittest.TestCase):
     """Test cases to improve coverage for manpage.py"""
 
     def test_extractname_edge_cases(self):
         """Test extractname with various edge cases"""
-        # Test with complex paths
-        self.assertEqual(
-            manpage.extractname('/very/long/path/to/file.1.gz'), 'file'
-        )
-        self.assertEqual(manpage.extractname('file.1.1.gz'), 'file.1')
-        self.assertEqual(manpage.extractname('file.1xyz.gz'), 'file')
-        self.assertEqual(manpage.extractname('file.1.1xyz.gz'), 'file.1')
+        cases = [
+            # Test with complex paths
+            ('/very/long/path/to/file.1.gz', 'file'),
+            ('file.1.1.gz', 'file.1'),
+            ('file.1xyz.gz', 'file'),
+            ('file.1.1xyz.gz', 'file.1'),
+        ]
+        for path, expected in cases:
+            with self.subTest(path=path):
+                self.assertEqual(manpage.extractname(path), expected)
 
     def test_bold_complex_cases(self):
         """Test bold function with complex HTML"""
@@ -36,11 +99,11 @@ class TestManpageCoverage(unittest.TestCase):
 
     def test_parsesynopsis_error_cases(self):
         """Test _parsesynopsis with invalid input"""
-        with self.assertRaises(ValueError):
-            manpage._parsesynopsis('/base', '/base: invalid format')
-
-        with self.assertRaises(ValueError):
-            manpage._parsesynopsis('/base', '/base: "no dash separator"')
+        for synopsis in ('/base: invalid format',
+                         '/base: "no dash separator"'):
+            with self.subTest(synopsis=synopsis):
+                with self.assertRaises(ValueError):
+                    manpage._parsesynopsis('/base', synopsis)
 
     def test_manpage_read_subprocess_error(self):
         """Test manpage.read() when subprocess fails"""
@@ -88,19 +151,7 @@ class TestManpageCoverage(unittest.TestCase):
         """Test parse() with synopsis processing"""
         mp = self._extracted_from_test_manpage_parse_multiple_synopsis_lines_3(
             '/test/echo.1.gz',
-            '''line1
-line2
-line3
-line4
-line5
-line6
-line7
-<p>Some content here</p>
-<p>More content</p>
-<p>Another paragraph</p>
-footer1
-footer2
-footer3''',
+            _HTML_FIXTURE_A,
             '/test/echo.1.gz: "echo - display a line of text"',
             'display a line of text',
         )
@@ -110,18 +161,7 @@ footer3''',
         """Test parse() with multiple synopsis lines"""
         mp = self._extracted_from_test_manpage_parse_multiple_synopsis_lines_3(
             '/test/prog.1.gz',
-            '''line1
-line2
-line3
-line4
-line5
-line6
-line7
-<p>Content paragraph</p>
-<p>Another paragraph</p>
-footer1
-footer2
-footer3''',
+            _HTML_FIXTURE_B,
             '''/test/prog.1.gz: "prog - first description"
 /test/prog.1.gz: "alias1 - same description"
 /test/prog.1.gz: "alias2 - same description"''',
@@ -144,35 +184,16 @@ footer3''',
 
     def test_parsetext_section_detection(self):
         """Test _parsetext with section headers"""
-        lines = [
-            '<b>NAME</b>',
-            'program - description',
-            '',
-            '<b>SYNOPSIS</b>',
-            'program [options]',
-            '',
-            '   <b>DESCRIPTION:</b>',
-            'This is a description',
-        ]
-
         paragraphs = self._ext_from_test_parsetext_bold_section_14(
-            lines, 3, 'NAME'
+            _PARSETEXT_SECTIONS, 3, 'NAME'
         )
         self.assertEqual(paragraphs[1].section, 'SYNOPSIS')
         self.assertEqual(paragraphs[2].section, 'DESCRIPTION')
 
     def test_parsetext_bold_section_detection(self):
         """Test _parsetext with bold section detection"""
-        lines = [
-            '    <b>OPTIONS:</b>',
-            '    -v, --verbose',
-            '        Enable verbose output',
-            '',
-            'More content'
-        ]
-
         self._ext_from_test_parsetext_bold_section_14(
-            lines, 2, 'OPTIONS'
+            _PARSETEXT_BOLD_SECTION, 2, 'OPTIONS'
         )
 
     def _ext_from_test_parsetext_bold_section_14(self, lines, arg1, arg2):
@@ -183,26 +204,13 @@ footer3''',
 
     def test_parsetext_href_replacement(self):
         """Test _parsetext with href replacement"""
-        lines = [
-            '<a href="file:///usr/share/man/man1/ls.1.gz?ls(1)">ls(1)</a>',
-            'Some text with link'
-        ]
-
-        paragraphs = list(manpage._parsetext(lines))
+        paragraphs = list(manpage._parsetext(_PARSETEXT_HREF))
 
         self.assertIn('manpages.ubuntu.com', paragraphs[0].text)
 
     def test_parsetext_replacement_patterns(self):
         """Test _parsetext with various replacement patterns"""
-        lines = [
-            'Text with \xe2\x80\xe2\x80\x98quotes\xe2\x80\xe2\x80\x99',
-            '',  # Empty line to separate paragraphs
-            'Text with \xe2\x94\xe2\x94\x82 pipe',
-            '',  # Empty line to separate paragraphs
-            'Text with \xc2\xb7 bullet'
-        ]
-
-        paragraphs = list(manpage._parsetext(lines))
+        paragraphs = list(manpage._parsetext(_PARSETEXT_REPLACEMENTS))
 
         # Should apply replacements without crashing
         self.assertEqual(len(paragraphs), 3)
@@ -1,9 +1,39 @@
+import collections
+import functools
 import unittest
 
 from explainshell import matcher, errors
 from . import helpers
 
-s = helpers.mockstore()
+
+@functools.lru_cache(maxsize=None)
+def _store():
+    """the mock store every test matches against, built on first use"""
+    return helpers.mockstore()
+
+
+matched = collections.namedtuple("matched", "groups expansions shelltext")
+
+
+@functools.lru_cache(maxsize=None)
+def _run(command):
+    """match command against the mock store once; tests only read what
+    comes back"""
+    m = matcher.matcher(command, _store())
+    groups = m.match()
+    # one line per shell group result, so a token can't match across two
+    shelltext = "\n".join(str(r.match) for r in groups[0].results)
+    return matched(groups, list(m.expansions), shelltext)
+
+
+# (command, expected groups, text one of the shell group's results holds)
+_SHELL_CASES = (
+    ("bar | baz", 3, "|"),  # pipe
+    ("bar > file.txt", 2, ">"),  # redirect
+    ("VAR=value bar", 2, "VAR=value"),  # assignment
+    ("bar # comment", 2, "# comment"),  # comment
+    ("bar; baz", 3, ";"),  # semicolon separator
+)
 
 
 class test_matcher(unittest.TestCase):
@@ -11,8 +41,7 @@ class test_matcher(unittest.TestCase):
 
     def assertBasicMatch(self, command, expected_groups=2):
         """Helper to test basic command matching"""
-        m = matcher.matcher(command, s)
-        groups = m.match()
+        groups = _run(command).groups
         self.assertEqual(len(groups), expected_groups)
         return groups
 
@@ -54,65 +83,27 @@ class test_matcher(unittest.TestCase):
     def test_unknown_command(self):
         """Test unknown command raises exception"""
         with self.assertRaises(errors.ProgramDoesNotExist):
-            matcher.matcher("unknowncommand", s).match()
-
-    def test_pipe_commands(self):
-        """Test piped commands"""
-        groups = self.assertBasicMatch("bar | baz", expected_groups=3)
+            matcher.matcher("unknowncommand", _store()).match()
 
-        # Check shell group has pipe
-        shell_results = groups[0].results
-        self.assertTrue(any("|" in str(r.match) for r in shell_results))
+    def test_shell_operators(self):
+        """Test commands whose shell group carries an operator or word"""
+        for command, expected_groups, token in _SHELL_CASES:
+            with self.subTest(command=command):
+                self.assertBasicMatch(command, expected_groups)
+                self.assertIn(token, _run(command).shelltext)
 
-        # Check both commands are present
+        # Check both piped commands are present
+        groups = _run("bar | baz").groups
         self.assertEqual(len(groups[1].results), 1)  # bar
         self.assertEqual(len(groups[2].results), 1)  # baz
 
-    def test_redirect(self):
-        """Test basic redirection"""
-        groups = self.assertBasicMatch("bar > file.txt")
-
-        # Should have shell group with redirect and command group
-        shell_results = groups[0].results
-        self.assertTrue(any(">" in str(r.match) for r in shell_results))
-
-    def test_assignment(self):
-        """Test variable assignment"""
-        groups = self.assertBasicMatch("VAR=value bar")
-
-        # Check assignment in shell group
-        shell_results = groups[0].results
-        self.assertTrue(
-            any("VAR=value" in str(r.match) for r in shell_results)
-        )
-
-    def test_comment(self):
-        """Test comment handling"""
-        groups = self.assertBasicMatch("bar # comment")
-
-        # Check comment in shell group
-        shell_results = groups[0].results
-        self.assertTrue(
-            any("# comment" in str(r.match) for r in shell_results)
-        )
-
-    def test_semicolon_separator(self):
-        """Test semicolon separated commands"""
-        groups = self.assertBasicMatch("bar; baz", expected_groups=3)
-
-        # Check semicolon in shell group
-        shell_results = groups[0].results
-        self.assertTrue(any(";" in str(r.match) for r in shell_results))
-
     def test_command_substitution_basic(self):
         """Test basic command substitution"""
         # Command substitution creates additional groups
         self.assertBasicMatch("bar $(echo test)", expected_groups=3)
 
         # Should have expansions
-        m = matcher.matcher("bar $(echo test)", s)
-        m.match()
-        self.assertTrue(len(m.expansions) > 0)
+        self.assertTrue(len(_run("bar $(echo test)").expansions) > 0)
 
     def test_function_definition(self):
         """Test function definition"""
@@ -124,23 +115,19 @@ class test_matcher(unittest.TestCase):
 
     def test_if_statement(self):
         """Test if statement"""
-        groups = self.assertBasicMatch(
-            "if bar; then baz; fi", expected_groups=3
-        )
+        command = "if bar; then baz; fi"
+        self.assertBasicMatch(command, expected_groups=3)
 
         # Check if keywords in shell group
-        shell_results = groups[0].results
-        shell_text = " ".join(str(r.match) for r in shell_results)
-        self.assertIn("if", shell_text)
+        self.assertIn("if", _run(command).shelltext)
 
     def test_for_loop(self):
         """Test for loop"""
-        groups = self.assertBasicMatch("for i in 1 2 3; do bar; done")
+        command = "for i in 1 2 3; do bar; done"
+        self.assertBasicMatch(command)
 
         # Check for keywords in shell group
-        shell_results = groups[0].results
-        shell_text = " ".join(str(r.match) for r in shell_results)
-        self.assertIn("for", shell_text)
+        self.assertIn("for", _run(command).shelltext)
 
     def test_multiple_options(self):
         """Test command with multiple options"""
@@ -1,14 +1,109 @@
 """Tests to improve coverage for matcher.py module"""
 
+import contextlib
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, NonCallableMock, call, patch
+
+import bashlex.ast
+import bashlex.parser
+
 from explainshell import matcher, errors, helpconstants
 
+# the attributes matcher reads off bashlex word nodes and store manpages;
+# mocks specced to these reject anything else instead of inventing it
+_WORD_SPEC = ("kind", "word", "pos", "parts")
+# visitredirect checks its output node with isinstance, so that mock is
+# specced from the node class itself
+_NODE_SPEC = bashlex.ast.node
+_MANPAGE_SPEC = (
+    "find_option",
+    "multicommand",
+    "partialmatch",
+    "arguments",
+    "nestedcommand",
+    "synopsis",
+)
+
+
+# what find_option is expected to have last been called with
+_CALL_V = call("-v")
+
+
+def _make_word_node(word=None, pos=None, parts=()):
+    """a bashlex word node stand-in"""
+    node = NonCallableMock(spec_set=_WORD_SPEC)
+    node.configure_mock(kind="word", word=word, pos=pos, parts=list(parts))
+    return node
+
+
+@contextlib.contextmanager
+def _patch_key(d, key, value):
+    """set d[key] to value for the duration, restoring only that key;
+    patch.dict would copy all of d to restore it"""
+    missing = object()
+    old = d.get(key, missing)
+    d[key] = value
+    try:
+        yield
+    finally:
+        if old is missing:
+            del d[key]
+        else:
+            d[key] = old
+
+
+def _make_manpage(**attrs):
+    """a store manpage stand-in with attrs preset"""
+    mp = NonCallableMock(spec_set=_MANPAGE_SPEC)
+    mp.configure_mock(**attrs)
+    return mp
+
+
+class _callrecorder(object):
+    """a stub method: returns ret and records each call's arguments"""
+
+    __slots__ = ("calls", "ret")
+
+    def __init__(self, ret=None):
+        self.calls = []
+        self.ret = ret
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+def setUpModule():
+    # run one real parse and match so bashlex and the matcher's code paths
+    # are loaded before the first test
+    store = MagicMock()
+    store.findmanpage.return_value = [MagicMock()]
+    matcher.matcher("echo hi | grep x", store).match()
+
 
 class TestMatcherCoverage(unittest.TestCase):
     """Test cases to improve coverage for matcher.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        # most tests only hand the store to matcher, so they share one
+        cls.store = MagicMock()
+        cls.store.findmanpage.return_value = [MagicMock()]
+
+        # no test here parses for real; the ones that reach match() set
+        # what the parser hands back
+        patcher = patch.object(bashlex.parser, "parsesingle")
+        cls.parse_mock = patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
     def setUp(self):
+        # the parser mock is shared, so drop the previous test's AST and
+        # calls before this one sets its own
+        self.parse_mock.reset_mock(return_value=True, side_effect=True)
+
+    def _fresh_store(self):
+        """give this test its own store, for tests that change how
+        findmanpage behaves"""
         self.store = MagicMock()
         self.store.findmanpage.return_value = [MagicMock()]
 
@@ -73,7 +168,7 @@ class TestMatcherCoverage(unittest.TestCase):
 
         result = m.find_option("-v")
         self.assertEqual(result, mock_option)
-        mock_manpage.find_option.assert_called_with("-v")
+        self.assertEqual(mock_manpage.find_option.call_args, _CALL_V)
 
     def test_visitreservedword_with_compound_context(self):
         """Test visitreservedword with compound command context"""
@@ -81,12 +176,11 @@ class TestMatcherCoverage(unittest.TestCase):
         m.compoundstack.append("for")
 
         # Mock node
-        node = MagicMock()
-        node.pos = [0, 3]
+        node = MagicMock(pos=[0, 3])
 
         # Test with compound-specific reserved word
-        with patch.dict(
-            helpconstants.COMPOUNDRESERVEDWORDS, {"for": {"do": "for do help"}}
+        with _patch_key(
+            helpconstants.COMPOUNDRESERVEDWORDS, "for", {"do": "for do help"}
         ):
             m.visitreservedword(node, "do")
 
@@ -98,13 +192,13 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("if [ $? -eq 0 ]; then echo ok; fi", self.store)
         m.compoundstack.append("if")
 
-        node = MagicMock()
-        node.pos = [15, 16]
+        node = MagicMock(pos=[15, 16])
 
         # Test with compound-specific operator
-        with patch.dict(
-            helpconstants.COMPOUNDRESERVEDWORDS, {
-                "if": {";": "if semicolon help"}}
+        with _patch_key(
+            helpconstants.COMPOUNDRESERVEDWORDS,
+            "if",
+            {";": "if semicolon help"},
         ):
             m.visitoperator(node, ";")
 
@@ -116,13 +210,10 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("echo hello > file", self.store)
 
         # Mock redirect node
-        node = MagicMock()
-        node.pos = [11, 17]
+        node = MagicMock(pos=[11, 17])
 
         # Mock output node as bashlex.ast.node with parts
-        import bashlex.ast
-
-        output = MagicMock(spec=bashlex.ast.node)
+        output = MagicMock(spec=_NODE_SPEC)
         output.pos = [13, 17]
         output.parts = [MagicMock()]
         output.parts[0].kind = "parameter"
@@ -136,8 +227,7 @@ class TestMatcherCoverage(unittest.TestCase):
         """Test visitredirect with file descriptor redirect"""
         m = matcher.matcher("echo hello 2>&1", self.store)
 
-        node = MagicMock()
-        node.pos = [11, 16]
+        node = MagicMock(pos=[11, 16])
 
         m.visitredirect(node, None, ">&", 1, None)
 
@@ -163,11 +253,10 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("", self.store)
 
         node = MagicMock()
-        redirect_part = MagicMock()
-        redirect_part.kind = "redirect"
+        redirect_part = MagicMock(kind="redirect")
         parts = [redirect_part]
 
-        with patch("bashlex.ast.findfirstkind", return_value=-1):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=-1):
             m.visitcommand(node, parts)
 
         # Should not create new groups
@@ -178,15 +267,13 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("echo hello", self.store)
 
         node = MagicMock()
-        word_node = MagicMock()
-        word_node.kind = "word"
-        word_node.word = "echo"
+        word_node = _make_word_node("echo")
         parts = [word_node]
 
         # Mark as already processed
         m.processed_command_words.add(id(word_node))
 
-        with patch("bashlex.ast.findfirstkind", return_value=0):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=0):
             m.visitcommand(node, parts)
 
         # Should not create new groups
@@ -198,38 +285,26 @@ class TestMatcherCoverage(unittest.TestCase):
         m.functions.add("myfunc")
 
         node = MagicMock()
-        word_node = self._extracted_from_test_visitcommand_function_call_(0, 6)
-        word_node.word = "myfunc"
-        arg_node = self._extracted_from_test_visitcommand_function_call_(7, 11)
-        arg_node.parts = []
+        word_node = _make_word_node("myfunc", [0, 6])
+        arg_node = _make_word_node(pos=[7, 11])
 
         parts = [word_node, arg_node]
 
-        with patch("bashlex.ast.findfirstkind", return_value=0):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=0):
             m.visitcommand(node, parts)
 
         # Should add matches for function call
         self.assertGreater(len(m.matches), 0)
 
-    # TODO Rename this here and in `test_visitcommand_function_call`
-    def _extracted_from_test_visitcommand_function_call_(self, arg0, arg1):
-        result = MagicMock()
-        result.kind = "word"
-        result.pos = [arg0, arg1]
-
-        return result
-
     def test_visitcommand_with_expansions(self):
         """Test visitcommand with word node having expansions"""
         m = matcher.matcher("$(echo test)", self.store)
 
         node = MagicMock()
-        word_node = MagicMock()
-        word_node.kind = "word"
-        word_node.parts = [MagicMock()]  # Has expansions
+        word_node = _make_word_node(parts=[MagicMock()])  # Has expansions
         parts = [word_node]
 
-        with patch("bashlex.ast.findfirstkind", return_value=0):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=0):
             m.visitcommand(node, parts)
 
         # Should create a group for unknown command with expansions
@@ -260,30 +335,28 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("", self.store)
         m.compoundstack.append("for")
 
-        node = MagicMock()
-        node.kind = "while"
+        node = MagicMock(kind="while")
 
         with patch("explainshell.matcher.logger") as mock_logger:
             m.visitnodeend(node)
-            mock_logger.warning.assert_called()
+            self.assertTrue(mock_logger.warning.called)
 
     def test_visitnodeend_empty_compound_stack(self):
         """Test visitnodeend with empty compound stack"""
         m = matcher.matcher("", self.store)
 
-        node = MagicMock()
-        node.kind = "for"
+        node = MagicMock(kind="for")
 
         with patch("explainshell.matcher.logger") as mock_logger:
             m.visitnodeend(node)
-            mock_logger.warning.assert_called()
+            self.assertTrue(mock_logger.warning.called)
 
     def test_startcommand_no_word_node(self):
         """Test startcommand with no word nodes"""
         m = matcher.matcher("", self.store)
 
         parts = []
-        with patch("bashlex.ast.findfirstkind", return_value=-1):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=-1):
             result = m.startcommand(None, parts, None)
 
         self.assertFalse(result)
@@ -292,29 +365,26 @@ class TestMatcherCoverage(unittest.TestCase):
         """Test startcommand with word node having parts"""
         m = matcher.matcher("", self.store)
 
-        word_node = MagicMock()
-        word_node.parts = [MagicMock()]  # Has expansions
+        word_node = _make_word_node(parts=[MagicMock()])  # Has expansions
         parts = [word_node]
 
-        with patch("bashlex.ast.findfirstkind", return_value=0):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=0):
             result = m.startcommand(None, parts, None)
 
         self.assertFalse(result)
 
     def test_startcommand_program_not_found(self):
         """Test startcommand when program doesn't exist"""
+        self._fresh_store()
         m = matcher.matcher("", self.store)
         self.store.findmanpage.side_effect = errors.ProgramDoesNotExist(
             "unknown"
         )
 
-        word_node = MagicMock()
-        word_node.word = "unknown"
-        word_node.parts = []
-        word_node.pos = [0, 7]  # Add required pos attribute
+        word_node = _make_word_node("unknown", [0, 7])
         parts = [word_node]
 
-        with patch("bashlex.ast.findfirstkind", return_value=0):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=0):
             result = m.startcommand(None, parts, None)
 
         self.assertFalse(result)
@@ -324,96 +394,57 @@ class TestMatcherCoverage(unittest.TestCase):
 
     def test_startcommand_multicommand_success(self):
         """Test startcommand with successful multicommand lookup"""
+        self._fresh_store()
         m = matcher.matcher("git commit", self.store)
 
         # Mock manpages
-        git_manpage = MagicMock()
-        git_manpage.multicommand = True
-        git_commit_manpage = MagicMock()
+        git_manpage = _make_manpage(multicommand=True)
+        git_commit_manpage = _make_manpage()
 
         self.store.findmanpage.side_effect = [
             [git_manpage],  # First call for "git"
             [git_commit_manpage],  # Second call for "git commit"
         ]
 
-        word_node1 = (
-            self._extracted_from_test_startcommand_multicommand_success_15(
-                "git", 0, 3
-            )
-        )
-        word_node2 = (
-            self._extracted_from_test_startcommand_multicommand_success_15(
-                "commit", 4, 10
-            )
-        )
+        word_node1 = _make_word_node("git", [0, 3])
+        word_node2 = _make_word_node("commit", [4, 10])
         parts = [word_node1, word_node2]
 
-        with patch("bashlex.ast.findfirstkind", side_effect=[0, 0]):
+        with patch.object(bashlex.ast, "findfirstkind", side_effect=[0, 0]):
             result = m.startcommand(None, parts, None)
 
         self.assertTrue(result)
         self.assertEqual(len(m.groups), 2)
         self.assertEqual(m.groups[1].manpage, git_commit_manpage)
 
-    # TODO Rename this here and in `test_startcommand_multicommand_success`
-    def _extracted_from_test_startcommand_multicommand_success_15(
-        self, arg0, arg1, arg2
-    ):
-        result = MagicMock()
-        result.word = arg0
-        result.pos = [arg1, arg2]
-        result.parts = []
-
-        return result
-
     def test_startcommand_multicommand_failure(self):
         """Test startcommand with failed multicommand lookup"""
+        self._fresh_store()
         m = matcher.matcher("git unknown", self.store)
 
-        git_manpage = MagicMock()
-        git_manpage.multicommand = True
+        git_manpage = _make_manpage(multicommand=True)
 
         self.store.findmanpage.side_effect = [
             [git_manpage],  # First call succeeds
             errors.ProgramDoesNotExist("git unknown"),  # Second call fails
         ]
 
-        word_node1 = (
-            self._extracted_from_test_startcommand_multicommand_failure_13(
-                "git", 0, 3
-            )
-        )
-        word_node2 = (
-            self._extracted_from_test_startcommand_multicommand_failure_13(
-                "unknown", 4, 11
-            )
-        )
+        word_node1 = _make_word_node("git", [0, 3])
+        word_node2 = _make_word_node("unknown", [4, 11])
         parts = [word_node1, word_node2]
 
-        with patch("bashlex.ast.findfirstkind", side_effect=[0, 0]):
+        with patch.object(bashlex.ast, "findfirstkind", side_effect=[0, 0]):
             result = m.startcommand(None, parts, None)
 
         self.assertTrue(result)
         # Should use original git manpage
         self.assertEqual(m.groups[1].manpage, git_manpage)
 
-    # TODO Rename this here and in `test_startcommand_multicommand_failure`
-    def _extracted_from_test_startcommand_multicommand_failure_13(
-        self, arg0, arg1, arg2
-    ):
-        result = MagicMock()
-        result.word = arg0
-        result.pos = [arg1, arg2]
-        result.parts = []
-
-        return result
-
     def test_visitword_processed_command(self):
         """Test visitword with already processed command word"""
         m = matcher.matcher("echo", self.store)
 
-        node = MagicMock()
-        node.pos = [0, 4]
+        node = MagicMock(pos=[0, 4])
 
         # Mark as processed command
         m.processed_command_words.add(id(node))
@@ -427,8 +458,7 @@ class TestMatcherCoverage(unittest.TestCase):
         """Test visitword with redirect output position"""
         m = matcher.matcher("echo > file", self.store)
 
-        node = MagicMock()
-        node.pos = [7, 11]
+        node = MagicMock(pos=[7, 11])
 
         # Mark as redirect output position
         m.redirect_output_positions.add((7, 11))
@@ -448,8 +478,7 @@ class TestMatcherCoverage(unittest.TestCase):
         m.groups.append(mg)
         m.groupstack.append((None, mg, None))
 
-        node = MagicMock()
-        node.pos = [8, 11]
+        node = MagicMock(pos=[8, 11])
 
         m.visitword(node, "arg")
 
@@ -468,8 +497,7 @@ class TestMatcherCoverage(unittest.TestCase):
         m.groupstack.append((None, mg, ["\\;"]))  # type: ignore
         # End word list
 
-        node = MagicMock()
-        node.pos = [19, 21]
+        node = MagicMock(pos=[19, 21])
 
         # Add a previous match to reference
         m.matches.append(matcher.matchresult(0, 4, "find help", "find"))
@@ -487,12 +515,8 @@ class TestMatcherCoverage(unittest.TestCase):
         # Setup command with manpage
         mg = matcher.matchgroup("command0")
         mock_manpage = MagicMock()
-        mock_option_l = MagicMock()
-        mock_option_l.text = "long format"
-        mock_option_l.expectsarg = False
-        mock_option_a = MagicMock()
-        mock_option_a.text = "show all"
-        mock_option_a.expectsarg = False
+        mock_option_l = MagicMock(text="long format", expectsarg=False)
+        mock_option_a = MagicMock(text="show all", expectsarg=False)
 
         def find_option_side_effect(opt):
             options = {"-l": mock_option_l, "-a": mock_option_a}
@@ -505,9 +529,7 @@ class TestMatcherCoverage(unittest.TestCase):
         m.groups.append(mg)
         m.groupstack.append((None, mg, None))
 
-        node = MagicMock()
-        node.pos = [3, 6]
-        node.word = "-la"
+        node = MagicMock(pos=[3, 6], word="-la")
 
         m.visitword(node, "-la")
 
@@ -565,8 +587,7 @@ class TestMatcherCoverage(unittest.TestCase):
     def _extracted_from_test_visitword_nested_command_option_11(self, m, mg):
         m.groups.append(mg)
         m.groupstack.append((None, mg, None))
-        result = MagicMock()
-        result.expectsarg = True
+        result = MagicMock(expectsarg=True)
         return result
 
     def test_visitword_partial_match_success(self):
@@ -590,9 +611,7 @@ class TestMatcherCoverage(unittest.TestCase):
         self, mock_find, m
     ):
         mock_find.side_effect = [None, MagicMock(), MagicMock(), MagicMock()]
-        node = MagicMock()
-        node.pos = [4, 7]
-        node.word = "xvf"
+        node = MagicMock(pos=[4, 7], word="xvf")
         m.visitword(node, "xvf")
         self.assertGreater(len(m.matches), 0)
 
@@ -610,12 +629,12 @@ class TestMatcherCoverage(unittest.TestCase):
         self._ext_from_test_visitword_args_with_nested_cmd_11(
             mock_manpage, mg, m
         )
-        # Mock successful startcommand
-        with patch.object(m, "startcommand", return_value=True) as mock_start:
-            self._ext_from_test_visitword_args_with_nested_cmds_24(
-                5, 7, m, "ls"
-            )
-            mock_start.assert_called_once()
+        # Stub a successful startcommand
+        m.startcommand = startcommand = _callrecorder(True)
+        self._ext_from_test_visitword_args_with_nested_cmds_24(
+            5, 7, m, "ls"
+        )
+        self.assertEqual(len(startcommand.calls), 1)
 
     def _ext_from_test_visitword_args_with_nested_cmd_11(self,
                                                          mock_manpage,
@@ -630,8 +649,7 @@ class TestMatcherCoverage(unittest.TestCase):
                                                           arg1,
                                                           m,
                                                           arg3):
-        node = MagicMock()
-        node.pos = [arg0, arg1]
+        node = MagicMock(pos=[arg0, arg1])
         m.visitword(node, arg3)
 
     def test_visitfunction_compound_curly_braces(self):
@@ -639,21 +657,20 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("", self.store)
 
         # Mock function components
-        name = MagicMock()
-        name.word = "myfunc"
+        name = MagicMock(word="myfunc")
 
         # Mock compound body with curly braces
-        body = MagicMock()
-        body.list = [
-            MagicMock(kind="reservedword", word="{", pos=[7, 8]),
-            MagicMock(kind="command", pos=[9, 18]),
-            MagicMock(kind="reservedword", word="}", pos=[19, 20]),
-        ]
+        body = MagicMock(
+            list=[
+                MagicMock(kind="reservedword", word="{", pos=[7, 8]),
+                MagicMock(kind="command", pos=[9, 18]),
+                MagicMock(kind="reservedword", word="}", pos=[19, 20]),
+            ]
+        )
 
         parts = [name, body]
 
-        node = MagicMock()
-        node.pos = [0, 21]
+        node = MagicMock(pos=[0, 21])
 
         m.visitfunction(node, name, body, parts)
 
@@ -669,64 +686,51 @@ class TestMatcherCoverage(unittest.TestCase):
         """Test visitfunction with non-curly compound"""
         m = matcher.matcher("", self.store)
 
-        name = MagicMock()
-        name.word = "myfunc"
+        name = MagicMock(word="myfunc")
 
         # Mock compound body without curly braces
-        body = MagicMock()
-        body.list = [MagicMock(kind="command")]
+        body = MagicMock(list=[MagicMock(kind="command")])
 
-        before_body = MagicMock()
-        before_body.pos = [6, 8]
+        before_body = MagicMock(pos=[6, 8])
 
         parts = [name, before_body, body]
 
-        node = MagicMock()
-        node.pos = [0, 20]
+        node = MagicMock(pos=[0, 20])
 
-        with patch("bashlex.ast.findfirstkind", return_value=2):
+        with patch.object(bashlex.ast, "findfirstkind", return_value=2):
             with patch.object(m, "visit") as mock_visit:
                 m.visitfunction(node, name, body, parts)
 
-                mock_visit.assert_called_with(body)
-
-    def test_visitparameter_numeric_value(self):
-        """Test visitparameter with numeric value"""
-        m = matcher.matcher("", self.store)
-
-        node = MagicMock()
-        node.pos = [1, 3]
-
-        m.visitparameter(node, "42")
-
-        # Should add expansion with digits kind
-        self.assertEqual(len(m.expansions), 1)
-        self.assertEqual(m.expansions[0].kind, "parameter-digits")
+                self.assertEqual(mock_visit.call_args, call(body))
 
-    def test_visitparameter_special_parameter(self):
-        """Test visitparameter with special parameter"""
-        m = matcher.matcher("", self.store)
+    def test_visitparameter_kinds(self):
+        """Test visitparameter with numeric and special parameters"""
+        cases = [
+            ("42", "parameter-digits"),
+            ("?", "parameter-exit_status"),
+        ]
 
-        node = MagicMock()
-        node.pos = [1, 3]
+        node = MagicMock(pos=[1, 3])
 
-        with patch.dict(helpconstants.parameters, {"?": "exit_status"}):
-            m.visitparameter(node, "?")
+        with _patch_key(helpconstants.parameters, "?", "exit_status"):
+            for value, kind in cases:
+                with self.subTest(value=value):
+                    m = matcher.matcher("", self.store)
+                    m.visitparameter(node, value)
 
-        # Should add expansion with special kind
-        self.assertEqual(len(m.expansions), 1)
-        self.assertEqual(m.expansions[0].kind, "parameter-exit_status")
+                    self.assertEqual(len(m.expansions), 1)
+                    self.assertEqual(m.expansions[0].kind, kind)
 
     def test_match_no_ast(self):
         """Test match when no AST is generated"""
         m = matcher.matcher("", self.store)
 
-        with patch("bashlex.parser.parsesingle", return_value=None):
-            with patch("explainshell.matcher.logger") as mock_logger:
-                result = m.match()
+        self.parse_mock.return_value = None
+        with patch("explainshell.matcher.logger") as mock_logger:
+            result = m.match()
 
-                mock_logger.warning.assert_called()
-                self.assertEqual(len(result), 1)  # Only shell group
+            self.assertTrue(mock_logger.warning.called)
+            self.assertEqual(len(result), 1)  # Only shell group
 
     def test_match_single_command_error_reraise(self):
         """Test match reraises error for single command with no results"""
@@ -739,14 +743,12 @@ class TestMatcherCoverage(unittest.TestCase):
         mg.error = error
         m.groups.append(mg)
 
-        with patch.object(m, "visit"):
-            with patch("bashlex.parser.parsesingle") as mock_parse:
-                mock_ast = MagicMock()
-                mock_ast.kind = "command"
-                mock_parse.return_value = mock_ast
+        mock_ast = MagicMock(kind="command")
+        self.parse_mock.return_value = mock_ast
 
-                with self.assertRaises(errors.ProgramDoesNotExist):
-                    m.match()
+        with patch.object(m, "visit"):
+            with self.assertRaises(errors.ProgramDoesNotExist):
+                m.match()
 
     def test_markunparsedunknown_comment(self):
         """Test _markunparsedunknown with comment"""
@@ -783,9 +785,9 @@ class TestMatcherCoverage(unittest.TestCase):
         m = matcher.matcher("echo", self.store)
 
         matches = [matcher.matchresult(0, 4, "help", "echo")]
-        # Mock _resultindex to provide the required mapping
-        with patch.object(m, "_resultindex", return_value={matches[0]: 0}):
-            result = m._mergeadjacent(matches)
+        # Stub _resultindex to provide the required mapping
+        m._resultindex = _callrecorder({matches[0]: 0})
+        result = m._mergeadjacent(matches)
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0], matches[0])
@@ -800,11 +802,9 @@ class TestMatcherCoverage(unittest.TestCase):
             matcher.matchresult(2, 4, "help", "ho"),
         ]
 
-        # Mock the result index to make them adjacent
-        with patch.object(
-            m, "_resultindex", return_value={matches[0]: 0, matches[1]: 1}
-        ):
-            result = m._mergeadjacent(matches)
+        # Stub the result index to make them adjacent
+        m._resultindex = _callrecorder({matches[0]: 0, matches[1]: 1})
+        result = m._mergeadjacent(matches)
 
         # Should merge into single match
         self.assertEqual(len(result), 1)
@@ -581,6 +581,12 @@ class TestOptionsPerformance(unittest.TestCase):
         extracted_options = manpage.options
         self.assertEqual(len(extracted_options), 50)
 
+    def test_option_long_uppercase_word(self):
+        """Test _option on a long uppercase word with no valid ending"""
+        # every shorter option name used to be retried with the rest as
+        # its argument, which took seconds at this length
+        self.assertIsNone(options._option("-" + "A" * 20000 + ":"))
+
 
 if __name__ == "__main__":
     unittest.main()